@@ -3,12 +3,12 @@
 import argparse
 import os
 import sys
-import json
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 # Import parsers from the new modular system
+from json_io import dump_json_file
 from parsers import Problem, SonarQubeParser, DependencyCheckParser, CycloneDXParser
 
 def parse_arguments() -> argparse.Namespace:
@@ -112,50 +112,60 @@ def collect_problems(input_dir: Path, args: argparse.Namespace) -> List[Problem]
         print("No analysis tool outputs found in", input_dir)
         return problems
     
-    # Process SonarQube results if enabled and available
+    # Queue each enabled tool's parse: (process label, error label,
+    # result noun, parser class, report path)
+    jobs = []
     if "sonarqube" in tool_paths:
-        print("Processing SonarQube results...")
-        try:
-            parser = SonarQubeParser()
-            sonarqube_problems = parser.parse(tool_paths["sonarqube"])
-            problems.extend(sonarqube_problems)
-            print(f"  Found {len(sonarqube_problems)} SonarQube issues")
-        except Exception as e:
-            print(f"  Error parsing SonarQube results: {str(e)}")
+        jobs.append(("SonarQube results", "SonarQube results", "SonarQube issues",
+                     SonarQubeParser, tool_paths["sonarqube"]))
     elif args.sonarqube:
         print("Warning: SonarQube analysis was enabled but no results found")
-    
-    # Process Dependency Check results if enabled and available
+
     if "dependency-check" in tool_paths:
-        print("Processing Dependency-Check results...")
-        try:
-            parser = DependencyCheckParser()
-            depcheck_problems = parser.parse(tool_paths["dependency-check"])
-            problems.extend(depcheck_problems)
-            print(f"  Found {len(depcheck_problems)} vulnerabilities")
-        except Exception as e:
-            print(f"  Error parsing Dependency-Check results: {str(e)}")
+        jobs.append(("Dependency-Check results", "Dependency-Check results", "vulnerabilities",
+                     DependencyCheckParser, tool_paths["dependency-check"]))
     elif args.dependency_check:
         print("Warning: Dependency-Check was enabled but no results found")
-    
-    # Process CycloneDX SBOM if enabled and available
+
     if "sbom" in tool_paths:
-        print("Processing CycloneDX SBOM...")
-        try:
-            parser = CycloneDXParser()
-            sbom_problems = parser.parse(tool_paths["sbom"])
-            problems.extend(sbom_problems)
-            print(f"  Found {len(sbom_problems)} issues in SBOM")
-        except Exception as e:
-            print(f"  Error parsing SBOM: {str(e)}")
+        jobs.append(("CycloneDX SBOM", "SBOM", "issues in SBOM",
+                     CycloneDXParser, tool_paths["sbom"]))
     elif args.sbom:
         print("Warning: SBOM analysis was enabled but no SBOM file found")
-    
-    # Sort problems by severity
-    severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
-    problems.sort(key=lambda x: severity_order.get(x.severity, 999))
-    
-    return problems
+
+    # The reports are independent, so parse them concurrently and
+    # collect in submission order to keep output deterministic
+    if jobs:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = []
+            for process_label, error_label, noun, parser_cls, path in jobs:
+                print(f"Processing {process_label}...")
+                futures.append(
+                    (error_label, noun, executor.submit(parser_cls().parse, path))
+                )
+            for error_label, noun, future in futures:
+                try:
+                    tool_problems = future.result()
+                    problems.extend(tool_problems)
+                    print(f"  Found {len(tool_problems)} {noun}")
+                except Exception as e:
+                    print(f"  Error parsing {error_label}: {str(e)}")
+    
+    # Order problems by severity with a single bucketing pass: with only
+    # five known levels this replaces the O(n log n) comparison sort and
+    # its per-comparison lambda call with one dict lookup per problem,
+    # and stays stable within each severity
+    buckets = {sev: [] for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")}
+    unknown = []
+    for problem in problems:
+        bucket = buckets.get(problem.severity)
+        (bucket if bucket is not None else unknown).append(problem)
+
+    ordered = []
+    for bucket in buckets.values():
+        ordered.extend(bucket)
+    ordered.extend(unknown)
+    return ordered
 
 def main():
     """Main execution function."""
@@ -191,18 +201,7 @@ def main():
     
     # Write initial problems to a JSON file for debug
     problems_file = output_dir / "problems.json"
-    with open(problems_file, 'w') as f:
-        json.dump([{
-            "id": p.id,
-            "source": p.source,
-            "title": p.title,
-            "description": p.description,
-            "severity": p.severity,
-            "component": p.component,
-            "type": p.type,
-            "line": p.line,
-            "raw_data": p.raw_data
-        } for p in problems], f, indent=2)
+    dump_json_file(problems_file, [p.to_dict() for p in problems], indent=True)
     
     print(f"\nFound {len(problems)} potential issues.")
     print(f"{'='*80}")
@@ -223,30 +222,37 @@ def main():
     agent_system = AgentSystem(workspace_root, input_dir, config_dir, max_iterations=args.max_iterations)
     
     # Convert Problem dataclasses to dicts for the agent system
-    problems_as_dicts = [asdict(p) for p in problems]
+    problems_as_dicts = [p.to_dict() for p in problems]
     
     # Run analysis
     try:
         results = agent_system.analyze_problems(problems_as_dicts, output_dir=output_dir)
         agent_system.generate_report(output_dir)
         
-        # Count issues by priority - separate failed analyses and by type
-        failed_count = sum(1 for r in results if r.analysis_failed)
-        successful_results = [r for r in results if not r.analysis_failed]
-        
-        # Split by vulnerability vs code quality
-        is_vulnerability = lambda r: r.problem_type in ['vulnerability', 'security_hotspot']
-        is_code_quality = lambda r: r.problem_type in ['code_smell', 'bug', 'code-smell']
-        
-        # Vulnerabilities
-        important_vulns = sum(1 for r in successful_results if r.is_applicable and is_vulnerability(r) and r.severity in ["CRITICAL", "HIGH", "MEDIUM"])
-        low_vulns = sum(1 for r in successful_results if r.is_applicable and is_vulnerability(r) and r.severity in ["LOW", "TRIVIAL"])
-        
-        # Code quality
-        important_quality = sum(1 for r in successful_results if r.is_applicable and is_code_quality(r) and r.severity in ["CRITICAL", "HIGH", "MEDIUM"])
-        low_quality = sum(1 for r in successful_results if r.is_applicable and is_code_quality(r) and r.severity in ["LOW", "TRIVIAL"])
-        
-        dismissed_count = sum(1 for r in successful_results if not r.is_applicable)
+        # Count issues by priority in a single pass instead of six
+        # generator sweeps over the result list
+        vuln_types = {'vulnerability', 'security_hotspot'}
+        quality_types = {'code_smell', 'bug', 'code-smell'}
+        important_sevs = {"CRITICAL", "HIGH", "MEDIUM"}
+        low_sevs = {"LOW", "TRIVIAL"}
+
+        failed_count = dismissed_count = 0
+        important_vulns = low_vulns = important_quality = low_quality = 0
+        for r in results:
+            if r.analysis_failed:
+                failed_count += 1
+            elif not r.is_applicable:
+                dismissed_count += 1
+            elif r.problem_type in vuln_types:
+                if r.severity in important_sevs:
+                    important_vulns += 1
+                elif r.severity in low_sevs:
+                    low_vulns += 1
+            elif r.problem_type in quality_types:
+                if r.severity in important_sevs:
+                    important_quality += 1
+                elif r.severity in low_sevs:
+                    low_quality += 1
         
         print(f"\n{'='*80}")
         print("✅ ANALYSIS COMPLETE")
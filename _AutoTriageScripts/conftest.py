@@ -0,0 +1,7 @@
+"""
+Pytest configuration anchor.
+
+Marks _AutoTriageScripts as the pytest rootdir so the sibling modules
+(parsers, tools, analyze_dependencies, ...) are importable in tests via
+the pythonpath setting in pyproject.toml, without per-file sys.path hacks.
+"""
@@ -0,0 +1,58 @@
+"""
+JSON Loading Helpers
+
+Central place for decoding JSON tool outputs (SBOMs, scanner reports).
+Uses orjson when it happens to be installed — its C decoder is several
+times faster on megabyte-sized reports — and falls back to the stdlib
+json module otherwise, so no extra dependency is required.
+"""
+
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Encode an object to JSON bytes (2-space indent if requested)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+except ImportError:
+    import json
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Encode an object to JSON bytes (2-space indent if requested)."""
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Decode a JSON file in a single bytes read.
+
+    Reading bytes skips the incremental text decode that text-mode
+    file objects perform.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the contents are not valid JSON (both stdlib
+                    json and orjson decode errors subclass ValueError)
+    """
+    return json_loads(Path(file_path).read_bytes())
+
+
+def dump_json_file(file_path: Union[str, Path], obj: Any, indent: bool = False) -> None:
+    """
+    Encode an object and write it in a single bytes write.
+
+    With orjson installed the encode runs in its C serializer; the
+    stdlib fallback still avoids json.dump's incremental text writes.
+    """
+    Path(file_path).write_bytes(json_dumps_bytes(obj, indent=indent))
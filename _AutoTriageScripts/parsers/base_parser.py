@@ -4,17 +4,42 @@ Base Parser Interface
 Abstract base class and data structures for tool parsers.
 """
 
+import operator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+# Field order for Problem.to_dict; the attrgetter fetches all fields in
+# one C call instead of one LOAD_ATTR per field
+_PROBLEM_FIELDS = (
+    "id", "source", "title", "description", "severity",
+    "component", "type", "line", "raw_data",
+)
+_PROBLEM_GET = operator.attrgetter(*_PROBLEM_FIELDS)
+
+
+# Common severity mappings, built once instead of per normalize call
+_SEVERITY_MAP = {
+    "BLOCKER": "CRITICAL",
+    "CRITICAL": "CRITICAL",
+    "MAJOR": "HIGH",
+    "HIGH": "HIGH",
+    "MODERATE": "MEDIUM",
+    "MEDIUM": "MEDIUM",
+    "MINOR": "LOW",
+    "LOW": "LOW",
+    "INFO": "INFO",
+    "INFORMATIONAL": "INFO",
+}
+
+
+@dataclass(slots=True)
 class Problem:
     """
     Represents a security or code quality issue from any analysis tool.
-    
+
     This is a normalized format that all parsers must convert their
     tool-specific output into.
     """
@@ -28,6 +53,15 @@ class Problem:
     line: Optional[int] = None  # Line number if applicable
     raw_data: Optional[Dict[str, Any]] = None  # Original raw data from the tool
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict.
+
+        Unlike dataclasses.asdict, this does not recursively deep-copy
+        raw_data, which makes serializing large problem lists much cheaper.
+        """
+        return dict(zip(_PROBLEM_FIELDS, _PROBLEM_GET(self)))
+
 
 class BaseParser(ABC):
     """
@@ -95,23 +129,14 @@ class BaseParser(ABC):
         Returns:
             Normalized severity: CRITICAL, HIGH, MEDIUM, LOW, or INFO
         """
+        # Probe with the input as-is first: tool outputs are almost
+        # always uppercase already, so the common case is one dict
+        # lookup with no .upper() allocation
+        result = _SEVERITY_MAP.get(severity)
+        if result is not None:
+            return result
         severity = severity.upper()
-        
-        # Common mappings
-        severity_map = {
-            "BLOCKER": "CRITICAL",
-            "CRITICAL": "CRITICAL",
-            "MAJOR": "HIGH",
-            "HIGH": "HIGH",
-            "MODERATE": "MEDIUM",
-            "MEDIUM": "MEDIUM",
-            "MINOR": "LOW",
-            "LOW": "LOW",
-            "INFO": "INFO",
-            "INFORMATIONAL": "INFO",
-        }
-        
-        return severity_map.get(severity, severity)
+        return _SEVERITY_MAP.get(severity, severity)
     
     def validate_file(self, file_path: Path) -> bool:
         """
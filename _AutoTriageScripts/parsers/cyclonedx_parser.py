@@ -5,10 +5,11 @@ Parses CycloneDX Software Bill of Materials (SBOM) files.
 Can extract vulnerabilities if present in the SBOM.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from json_io import load_json_file
+
 from .base_parser import BaseParser, Problem
 
 
@@ -65,19 +66,42 @@ class CycloneDXParser(BaseParser):
         """
         if not self.validate_file(file_path):
             raise FileNotFoundError(f"CycloneDX SBOM file not found: {file_path}")
-        
+
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = load_json_file(file_path)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in CycloneDX SBOM: {str(e)}")
-        
+
+        return self.parse_data(data)
+
+    def parse_data(self, data: Dict[str, Any], parse_components: Optional[bool] = None) -> List[Problem]:
+        """
+        Extract problems from an already-decoded CycloneDX SBOM document.
+
+        Useful when the same SBOM needs to be processed with different
+        configurations: decode the JSON once, then call this method with
+        each configuration instead of re-reading the file.
+
+        Args:
+            data: Decoded SBOM document (as returned by json.load)
+            parse_components: Override the parser's parse_components config
+                             for this call (None = use parser config)
+
+        Returns:
+            List of Problem objects
+
+        Raises:
+            ValueError: If the document is not a valid CycloneDX SBOM
+        """
         # Validate it's a CycloneDX SBOM
         if data.get("bomFormat") != "CycloneDX":
             raise ValueError("File is not a valid CycloneDX SBOM (missing bomFormat)")
-        
+
+        if parse_components is None:
+            parse_components = self.parse_components
+
         problems = []
-        
+
         # Parse vulnerabilities if present
         vulnerabilities = data.get("vulnerabilities", [])
         if vulnerabilities:
@@ -89,9 +113,9 @@ class CycloneDXParser(BaseParser):
                 except Exception as e:
                     print(f"Warning: Skipping malformed vulnerability: {str(e)}")
                     continue
-        
+
         # Optionally parse components as informational items
-        if self.parse_components:
+        if parse_components:
             components = data.get("components", [])
             for component in components:
                 try:
@@ -99,7 +123,7 @@ class CycloneDXParser(BaseParser):
                 except Exception as e:
                     print(f"Warning: Skipping malformed component: {str(e)}")
                     continue
-        
+
         return problems
     
     def _parse_vulnerability(
@@ -4,13 +4,27 @@ OWASP Dependency-Check Parser
 Parses OWASP Dependency-Check vulnerability reports.
 """
 
-import json
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 
+from json_io import load_json_file
+
 from .base_parser import BaseParser, Problem
 
 
+# Dependency-Check severity mappings, built once instead of per call
+_DEPCHECK_SEVERITY_MAP = {
+    "CRITICAL": "CRITICAL",
+    "HIGH": "HIGH",
+    "MEDIUM": "MEDIUM",
+    "MODERATE": "MEDIUM",
+    "LOW": "LOW",
+    "INFO": "INFO",
+    "INFORMATIONAL": "INFO",
+}
+
+
 class DependencyCheckParser(BaseParser):
     """
     Parser for OWASP Dependency-Check reports.
@@ -63,9 +77,8 @@ class DependencyCheckParser(BaseParser):
             raise FileNotFoundError(f"Dependency-Check report not found: {file_path}")
         
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = load_json_file(file_path)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in Dependency-Check file: {str(e)}")
         
         dependencies = data.get("dependencies", [])
@@ -115,10 +128,12 @@ class DependencyCheckParser(BaseParser):
         Returns:
             Problem object
         """
-        # Build description with CWE information if available
+        # Build description with CWE information if available. CWE ids
+        # repeat heavily across vulnerabilities, so interning them keeps
+        # one shared string per id instead of a copy per vulnerability.
         description = vuln.get("description", "")
         if vuln.get("cwes"):
-            cwe_list = ", ".join(vuln["cwes"])
+            cwe_list = ", ".join(map(sys.intern, vuln["cwes"]))
             description = f"CWEs: {cwe_list}\n{description}"
         
         # Normalize severity
@@ -155,21 +170,13 @@ class DependencyCheckParser(BaseParser):
         Dependency-Check uses: CRITICAL, HIGH, MEDIUM, LOW
         These already match our standard format.
         """
+        # Dependency-Check already uses standard uppercase levels, so
+        # the first probe usually hits without the .upper() allocation
+        result = _DEPCHECK_SEVERITY_MAP.get(severity)
+        if result is not None:
+            return result
         severity = severity.upper()
-        
-        # Dependency-Check already uses standard severity levels
-        # but we'll include the mapping for clarity
-        severity_map = {
-            "CRITICAL": "CRITICAL",
-            "HIGH": "HIGH",
-            "MEDIUM": "MEDIUM",
-            "MODERATE": "MEDIUM",
-            "LOW": "LOW",
-            "INFO": "INFO",
-            "INFORMATIONAL": "INFO",
-        }
-        
-        return severity_map.get(severity, severity)
+        return _DEPCHECK_SEVERITY_MAP.get(severity, severity)
     
     def get_tool_name(self) -> str:
         """Get the tool name."""
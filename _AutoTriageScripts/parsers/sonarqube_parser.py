@@ -4,13 +4,24 @@ SonarQube Parser
 Parses SonarQube analysis results (sonar-issues.json format).
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any
 
+from json_io import load_json_file
+
 from .base_parser import BaseParser, Problem
 
 
+# SonarQube severity mappings, built once instead of per normalize call
+_SONAR_SEVERITY_MAP = {
+    "BLOCKER": "CRITICAL",
+    "CRITICAL": "CRITICAL",
+    "MAJOR": "HIGH",
+    "MINOR": "LOW",
+    "INFO": "INFO",
+}
+
+
 class SonarQubeParser(BaseParser):
     """
     Parser for SonarQube issues export.
@@ -60,9 +71,8 @@ class SonarQubeParser(BaseParser):
         
         # Parse regular issues
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = load_json_file(file_path)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in SonarQube file: {str(e)}")
         
         issues = data.get("issues", [])
@@ -100,9 +110,8 @@ class SonarQubeParser(BaseParser):
             List of Problem objects (empty if errors or insufficient permissions)
         """
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = load_json_file(file_path)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in hotspots file: {str(e)}")
         
         # Check for API errors (e.g., insufficient privileges)
@@ -195,17 +204,13 @@ class SonarQubeParser(BaseParser):
         SonarQube uses: BLOCKER, CRITICAL, MAJOR, MINOR, INFO
         We normalize to: CRITICAL, HIGH, MEDIUM, LOW, INFO
         """
+        # SonarQube emits uppercase already, so the first probe usually
+        # hits without the .upper() allocation
+        result = _SONAR_SEVERITY_MAP.get(severity)
+        if result is not None:
+            return result
         severity = severity.upper()
-        
-        severity_map = {
-            "BLOCKER": "CRITICAL",
-            "CRITICAL": "CRITICAL",
-            "MAJOR": "HIGH",
-            "MINOR": "LOW",
-            "INFO": "INFO",
-        }
-        
-        return severity_map.get(severity, severity)
+        return _SONAR_SEVERITY_MAP.get(severity, severity)
     
     def get_tool_name(self) -> str:
         """Get the tool name."""
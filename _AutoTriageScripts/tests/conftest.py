@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the AutoTriage test suite.
+"""
+
+import functools
+from pathlib import Path
+
+import pytest
+
+# Repo-level directory holding example tool outputs used by the tests
+EXAMPLE_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "_example_output"
+
+
+@functools.lru_cache(maxsize=1)
+def collect_example_files():
+    """
+    Map relative posix paths (e.g. 'SonarQube/sonar-issues.json') to
+    absolute paths for every example JSON file.
+
+    Built with a single directory walk so tests can look up example files
+    with a dict get instead of issuing a stat() per existence probe. The
+    lru_cache makes that one walk per process even when test functions
+    fall back to calling this directly (their defaulted example_files
+    parameters are never fixture-injected by pytest).
+    """
+    if not EXAMPLE_OUTPUT_DIR.exists():
+        return {}
+    return {
+        path.relative_to(EXAMPLE_OUTPUT_DIR).as_posix(): path
+        for path in EXAMPLE_OUTPUT_DIR.rglob("*.json")
+    }
+
+
+@pytest.fixture(scope="session")
+def example_files():
+    """Session-scoped existence map for the example output files."""
+    return collect_example_files()
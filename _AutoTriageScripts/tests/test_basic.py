@@ -8,22 +8,25 @@ import json
 import sys
 from pathlib import Path
 
-# Add parent directory to path to import modules
-# (tests are in tests/ subdirectory, modules are in parent)
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 
-def test_problem_parsing():
+
+def test_problem_parsing(example_files=None):
     """Test that we can parse the example problems.json file."""
     print("Testing problem parsing...")
     
     from analyze_dependencies import parse_sonarqube_issues, parse_dependency_check_issues
+    from conftest import collect_example_files
     
-    # Test with example data
-    example_dir = Path(__file__).parent.parent / "_example_output"
+    if example_files is None:
+        example_files = collect_example_files()
     
     # Test SonarQube parsing
-    sonar_file = example_dir / "SonarQube" / "sonar-issues.json"
-    if sonar_file.exists():
+    sonar_file = example_files.get("SonarQube/sonar-issues.json")
+    if sonar_file:
         problems = parse_sonarqube_issues(sonar_file)
         print(f"✓ Parsed {len(problems)} SonarQube issues")
         assert len(problems) > 0, "Should have found some SonarQube issues"
@@ -31,8 +34,8 @@ def test_problem_parsing():
         print("⚠ SonarQube example file not found, skipping")
     
     # Test Dependency-Check parsing
-    depcheck_file = example_dir / "Dependency-Check" / "dependency-check-report.json"
-    if depcheck_file.exists():
+    depcheck_file = example_files.get("Dependency-Check/dependency-check-report.json")
+    if depcheck_file:
         problems = parse_dependency_check_issues(depcheck_file)
         print(f"✓ Parsed {len(problems)} dependency issues")
         assert len(problems) > 0, "Should have found some dependency issues"
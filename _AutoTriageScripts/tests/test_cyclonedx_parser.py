@@ -3,30 +3,26 @@
 Quick test for CycloneDX parser
 """
 
+import json
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 
 from parsers import CycloneDXParser
+from conftest import collect_example_files
 
-def test_cyclonedx_parser():
+def test_cyclonedx_parser(example_files=None):
     """Test CycloneDX parser with example SBOM"""
     print("Testing CycloneDX Parser...")
-    
-    # Try multiple possible paths
-    test_paths = [
-        Path("_example_output/CycloneDX/sbom.json"),
-        Path("../_example_output/CycloneDX/sbom.json"),
-    ]
-    
-    test_file = None
-    for path in test_paths:
-        if path.exists():
-            test_file = path
-            break
-    
+
+    if example_files is None:
+        example_files = collect_example_files()
+
+    test_file = example_files.get("CycloneDX/sbom.json")
     if not test_file:
         print("❌ Test SBOM file not found")
         return False
@@ -34,21 +30,24 @@ def test_cyclonedx_parser():
     print(f"  Using SBOM file: {test_file}")
     
     try:
+        # Decode the SBOM once and reuse it for both configurations
+        with open(test_file) as f:
+            doc = json.load(f)
+
         # Parse with default config (no vulnerabilities expected)
         parser = CycloneDXParser()
-        problems = parser.parse(test_file)
-        
+        problems = parser.parse_data(doc)
+
         print(f"  ✅ Parsed successfully")
         print(f"  Found {len(problems)} problems")
-        
+
         if problems:
             print(f"  Sample problem: {problems[0].id}")
         else:
             print("  (SBOM has no vulnerabilities - this is expected)")
-        
-        # Also test with component parsing enabled
-        parser_with_components = CycloneDXParser(config={"parse_components": True})
-        problems_with_comps = parser_with_components.parse(test_file)
+
+        # Also test with component parsing enabled (same parser, same document)
+        problems_with_comps = parser.parse_data(doc, parse_components=True)
         print(f"  With components enabled: {len(problems_with_comps)} items")
         
         return True
@@ -6,8 +6,10 @@ Test modular tool system
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 
 from tools import get_all_tool_classes, get_tool_class, get_all_tool_metadata
 
@@ -7,12 +7,13 @@ as the old parsing functions.
 import json
 import sys
 from pathlib import Path
-from dataclasses import asdict
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 from parsers import Problem, SonarQubeParser, DependencyCheckParser
+from conftest import collect_example_files
 
 
 # OLD PARSING FUNCTIONS (for comparison)
@@ -95,7 +96,7 @@ def old_parse_dependency_check_issues(report_file: Path):
 
 def problems_to_dict(problems):
     """Convert Problem objects to dicts for comparison"""
-    return [asdict(p) for p in problems]
+    return [p.to_dict() for p in problems]
 
 
 def compare_problems(old_problems, new_problems):
@@ -117,17 +118,17 @@ def compare_problems(old_problems, new_problems):
     return all_match
 
 
-def test_sonarqube_parser():
+def test_sonarqube_parser(example_files=None):
     """Test SonarQube parser compatibility"""
     print("\n" + "="*60)
     print("Testing SonarQube Parser")
     print("="*60)
-    
-    test_file = Path("../_example_output/SonarQube/sonar-issues.json")
-    if not test_file.exists():
-        test_file = Path("_example_output/SonarQube/sonar-issues.json")
-    
-    if not test_file.exists():
+
+    if example_files is None:
+        example_files = collect_example_files()
+
+    test_file = example_files.get("SonarQube/sonar-issues.json")
+    if not test_file:
         print("⚠️  Test file not found, skipping")
         return True
     
@@ -150,17 +151,17 @@ def test_sonarqube_parser():
         return False
 
 
-def test_dependency_check_parser():
+def test_dependency_check_parser(example_files=None):
     """Test Dependency-Check parser compatibility"""
     print("\n" + "="*60)
     print("Testing Dependency-Check Parser")
     print("="*60)
-    
-    test_file = Path("../_example_output/Dependency-Check/dependency-check-report.json")
-    if not test_file.exists():
-        test_file = Path("_example_output/Dependency-Check/dependency-check-report.json")
-    
-    if not test_file.exists():
+
+    if example_files is None:
+        example_files = collect_example_files()
+
+    test_file = example_files.get("Dependency-Check/dependency-check-report.json")
+    if not test_file:
         print("⚠️  Test file not found, skipping")
         return True
     
@@ -5,11 +5,14 @@ Test tool availability filtering
 
 import sys
 import json
+import os
 import shutil
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 
 from tool_availability import ToolAvailabilityChecker, load_tools_with_requirements
 
@@ -26,10 +29,13 @@ def setup_test_environment():
         "specVersion": "1.4",
         "components": []
     }
-    
-    with open(sbom_dir / "sbom.json", "w") as f:
-        json.dump(dummy_sbom, f)
-    
+
+    # Serialize in one shot and swap into place atomically so a half-written
+    # sbom.json is never visible to concurrently running tests
+    tmp_file = sbom_dir / "sbom.json.tmp"
+    tmp_file.write_bytes(json.dumps(dummy_sbom).encode("utf-8"))
+    os.replace(tmp_file, sbom_dir / "sbom.json")
+
     return test_inputs
 
 
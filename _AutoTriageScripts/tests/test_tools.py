@@ -6,9 +6,10 @@ Test the tool executor implementations.
 import sys
 from pathlib import Path
 
-# Add to path
-# (tests are in tests/ subdirectory, modules are in parent)
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
 
 from tool_executor import ToolExecutor
 
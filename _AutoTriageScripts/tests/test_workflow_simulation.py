@@ -9,6 +9,11 @@ import sys
 import os
 from pathlib import Path
 
+# Add parent directory to path for direct script execution
+# (appended so the tests dir keeps precedence for conftest imports);
+# pytest gets it from pyproject's pythonpath instead
+sys.path.append(str(Path(__file__).parent.parent))
+
 def test_workflow_simulation():
     """Simulate a workflow run with example data."""
     print("=" * 60)
@@ -24,9 +29,6 @@ def test_workflow_simulation():
     # Create test output directory
     test_output.mkdir(exist_ok=True)
     
-    # Import the main function
-    # (tests are in tests/ subdirectory, modules are in parent)
-    sys.path.insert(0, str(Path(__file__).parent.parent))
     from analyze_dependencies import collect_problems, parse_arguments
     from analysis_agent import AgentSystem
     
@@ -6,9 +6,50 @@ Determines which tools are available based on their requirements.
 Prevents the LLM from trying to use tools that can't function.
 """
 
+import functools
 import json
+import os
+import shutil
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+# How long a cached existence result stays valid. Missing paths are the
+# expensive case (negative dentry lookups cost a syscall every time), and
+# a short TTL means files created mid-run are still picked up promptly.
+_EXISTS_TTL = 2.0
+
+_exists_cache: Dict[str, Tuple[bool, float]] = {}
+
+
+def _path_exists(path: str) -> bool:
+    """
+    Existence check with a short-TTL cache.
+
+    Tool-availability checks probe the same paths (e.g. the SBOM file)
+    once per tool, so each unique path — present or absent — is stat()ed
+    at most once per TTL window instead of once per check. Files created
+    externally during the window are observed once the TTL lapses.
+    """
+    now = time.monotonic()
+    cached = _exists_cache.get(path)
+    if cached is not None and (now - cached[1]) < _EXISTS_TTL:
+        return cached[0]
+
+    exists = os.path.exists(path)
+    _exists_cache[path] = (exists, now)
+    return exists
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(executable: str) -> Optional[str]:
+    """
+    Cached shutil.which lookup.
+
+    Scanning PATH stats every candidate entry, so the result is cached
+    per process: all checker instances share one PATH scan per executable.
+    """
+    return shutil.which(executable)
 
 
 class ToolAvailabilityChecker:
@@ -20,20 +61,24 @@ class ToolAvailabilityChecker:
     - Executable availability (e.g., grep, git)
     - Configuration settings
     """
-    
+
+    # Process-wide cache of checked requirements, shared by all checker
+    # instances. Keys include the workspace/input dirs so checkers pointed
+    # at different directories don't see each other's results; entries
+    # expire on the same TTL as the existence cache so inputs created
+    # mid-run (e.g. an SBOM written after startup) are still picked up.
+    _requirement_cache: Dict[Tuple, Tuple[bool, float]] = {}
+
     def __init__(self, workspace_root: Path, input_dir: Path):
         """
         Initialize the availability checker.
-        
+
         Args:
             workspace_root: Root directory of the workspace being analyzed
             input_dir: Directory containing analysis inputs (SBOM, etc.)
         """
         self.workspace_root = workspace_root
         self.input_dir = input_dir
-        
-        # Cache of checked requirements
-        self._requirement_cache = {}
     
     def check_file_exists(self, file_path: str) -> bool:
         """
@@ -46,34 +91,33 @@ class ToolAvailabilityChecker:
         Returns:
             True if file exists, False otherwise
         """
+        for candidate in self._resolve_candidates(file_path):
+            if _path_exists(candidate):
+                return True
+        return False
+
+    def _resolve_candidates(self, file_path: str) -> Tuple[str, ...]:
+        """
+        Resolve a requirement path into the absolute path(s) to probe.
+
+        Placeholders and absolute paths yield a single candidate; bare
+        relative paths are tried against input_dir then workspace_root.
+        """
         # Replace placeholders with actual paths
         if "{input_dir}" in file_path:
-            # Replace placeholder and check directly
-            resolved_path = file_path.replace("{input_dir}", str(self.input_dir))
-            return Path(resolved_path).exists()
-        
+            return (file_path.replace("{input_dir}", str(self.input_dir)),)
+
         if "{workspace_root}" in file_path:
-            # Replace placeholder and check directly
-            resolved_path = file_path.replace("{workspace_root}", str(self.workspace_root))
-            return Path(resolved_path).exists()
-        
+            return (file_path.replace("{workspace_root}", str(self.workspace_root)),)
+
         # No placeholders - try relative paths
         path = Path(file_path)
-        
+
         if path.is_absolute():
-            return path.exists()
-        
-        # Try relative to input_dir first
-        input_path = self.input_dir / path
-        if input_path.exists():
-            return True
-        
-        # Then try relative to workspace_root
-        workspace_path = self.workspace_root / path
-        if workspace_path.exists():
-            return True
-        
-        return False
+            return (str(path),)
+
+        # Try relative to input_dir first, then workspace_root
+        return (str(self.input_dir / path), str(self.workspace_root / path))
     
     def check_requirement(self, requirement: Dict[str, Any]) -> bool:
         """
@@ -93,9 +137,8 @@ class ToolAvailabilityChecker:
         
         elif req_type == "executable":
             # Check if executable is available in PATH
-            import shutil
             executable = requirement.get("name", "")
-            return shutil.which(executable) is not None
+            return _which_cached(executable) is not None
         
         elif req_type == "optional":
             # Optional requirements always pass (tool works better with it but doesn't need it)
@@ -122,60 +165,75 @@ class ToolAvailabilityChecker:
         if not requirements:
             return True
         
-        # All requirements must be met
-        for req in requirements:
-            cache_key = f"{req.get('type')}:{req.get('path', req.get('name', ''))}"
-            
-            # Check cache first
-            if cache_key not in self._requirement_cache:
-                self._requirement_cache[cache_key] = self.check_requirement(req)
-            
-            if not self._requirement_cache[cache_key]:
-                return False
-        
-        return True
+        # All requirements must be met (generator short-circuits on the
+        # first failure)
+        return all(self._check_requirement_cached(req) for req in requirements)
+
+    def _check_requirement_cached(self, req: Dict[str, Any]) -> bool:
+        """Check a requirement, memoizing the result for the TTL window."""
+        # Tuple keys hash without building an intermediate string
+        cache_key = (
+            str(self.workspace_root),
+            str(self.input_dir),
+            req.get("type"),
+            req.get("path") or req.get("name") or "",
+        )
+
+        now = time.monotonic()
+        cached = self._requirement_cache.get(cache_key)
+        if cached is not None and (now - cached[1]) < _EXISTS_TTL:
+            return cached[0]
+
+        result = self.check_requirement(req)
+        self._requirement_cache[cache_key] = (result, now)
+        return result
     
+    def _partition_tools(
+        self, all_tools: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Set[str]]:
+        """
+        Split tools into (available definitions, unavailable names) in a
+        single pass over the requirement checks.
+        """
+        available = []
+        unavailable = set()
+
+        for tool in all_tools:
+            if self.check_tool_available(tool):
+                available.append(tool)
+            else:
+                unavailable.add(tool["name"])
+
+        return available, unavailable
+
     def get_available_tools(self, all_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Filter tools to only those that are available.
-        
+
         Args:
             all_tools: List of all tool definitions
-        
+
         Returns:
             List of available tool definitions
         """
-        available = []
-        unavailable_tools = []
-        
-        for tool in all_tools:
-            if self.check_tool_available(tool):
-                available.append(tool)
-            else:
-                unavailable_tools.append(tool["name"])
-        
-        if unavailable_tools:
-            print(f"  ℹ️  Tools filtered out (requirements not met): {', '.join(unavailable_tools)}")
-        
+        available, unavailable = self._partition_tools(all_tools)
+
+        if unavailable:
+            print(f"  ℹ️  Tools filtered out (requirements not met): {', '.join(sorted(unavailable))}")
+
         return available
-    
+
     def get_unavailable_tool_names(self, all_tools: List[Dict[str, Any]]) -> Set[str]:
         """
         Get names of tools that are NOT available.
-        
+
         Args:
             all_tools: List of all tool definitions
-        
+
         Returns:
             Set of tool names that are unavailable
         """
-        unavailable = set()
-        
-        for tool in all_tools:
-            if not self.check_tool_available(tool):
-                unavailable.add(tool["name"])
-        
-        return unavailable
+        return self._partition_tools(all_tools)[1]
 
 
 def load_tools_with_requirements() -> List[Dict[str, Any]]:
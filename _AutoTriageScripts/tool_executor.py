@@ -16,22 +16,29 @@ class ToolExecutor:
     def __init__(self, workspace_root: Path, input_dir: Path):
         self.workspace_root = workspace_root
         self.input_dir = input_dir
-    
+        # Instantiated tools, keyed by name. Tools are stateless between
+        # execute() calls, so one instance per executor is reused for the
+        # whole session instead of constructing a fresh one per call.
+        self._tool_instances: Dict[str, Any] = {}
+
     def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a tool and return results.
-        
+
         Args:
             tool_name: Name of the tool to execute
             parameters: Parameters for the tool
-        
+
         Returns:
             Dictionary with tool results
         """
         try:
-            # Get the tool instance from the modular tool system
-            tool = get_tool(tool_name, self.workspace_root, self.input_dir)
-            
+            # Get the cached tool instance, constructing it on first use
+            tool = self._tool_instances.get(tool_name)
+            if tool is None:
+                tool = get_tool(tool_name, self.workspace_root, self.input_dir)
+                self._tool_instances[tool_name] = tool
+
             # Execute the tool (tool has access to workspace_root and input_dir via self)
             result = tool.execute(parameters)
             
@@ -6,43 +6,42 @@ Each tool is self-contained with its implementation and metadata.
 """
 
 import importlib
-import inspect
+import pkgutil
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 from .base_tool import BaseTool
 
 # Registry of all available tool classes
 _TOOL_REGISTRY: Dict[str, Type[BaseTool]] = {}
 
+# Metadata list built lazily on first request (metadata is class-level,
+# so it never changes after discovery)
+_METADATA_CACHE: Optional[List[Dict]] = None
+
 
 def _discover_tools():
     """
     Automatically discover all tool classes in this directory.
-    
-    Looks for classes that extend BaseTool in all .py files
-    (except base_tool.py and __init__.py).
+
+    Each tool module declares its class via a TOOL_CLASS attribute; a
+    single pkgutil.iter_modules pass imports the modules and registers
+    those classes. This avoids inspect.getmembers reflection (which walks
+    every class a module imports) and skips __pycache__ automatically.
     """
     tools_dir = Path(__file__).parent
-    
-    for tool_file in tools_dir.glob("*.py"):
-        # Skip base_tool.py and __init__.py
-        if tool_file.name in ["base_tool.py", "__init__.py"]:
+
+    for module_info in pkgutil.iter_modules([str(tools_dir)]):
+        if module_info.name == "base_tool":
             continue
-        
-        # Import the module
-        module_name = f"tools.{tool_file.stem}"
+
         try:
-            module = importlib.import_module(module_name)
-            
-            # Find all BaseTool subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, BaseTool) and obj is not BaseTool:
-                    # Register the tool by its name attribute
-                    if hasattr(obj, 'name') and obj.name:
-                        _TOOL_REGISTRY[obj.name] = obj
+            module = importlib.import_module(f"tools.{module_info.name}")
+            tool_class = getattr(module, "TOOL_CLASS", None)
+            if tool_class is not None and getattr(tool_class, "name", None):
+                _TOOL_REGISTRY[tool_class.name] = tool_class
         except Exception as e:
-            print(f"Warning: Failed to load tool from {tool_file.name}: {str(e)}")
+            print(f"Warning: Failed to load tool from {module_info.name}.py: {str(e)}")
 
 
 def get_all_tool_classes() -> Dict[str, Type[BaseTool]]:
@@ -52,8 +51,6 @@ def get_all_tool_classes() -> Dict[str, Type[BaseTool]]:
     Returns:
         Dictionary mapping tool names to tool classes
     """
-    if not _TOOL_REGISTRY:
-        _discover_tools()
     return _TOOL_REGISTRY.copy()
 
 
@@ -70,8 +67,6 @@ def get_tool_class(tool_name: str) -> Type[BaseTool]:
     Raises:
         KeyError: If tool not found
     """
-    if not _TOOL_REGISTRY:
-        _discover_tools()
     return _TOOL_REGISTRY[tool_name]
 
 
@@ -90,9 +85,6 @@ def get_tool(tool_name: str, workspace_root: Path = None, input_dir: Path = None
     Raises:
         KeyError: If tool not found
     """
-    if not _TOOL_REGISTRY:
-        _discover_tools()
-    
     tool_class = _TOOL_REGISTRY[tool_name]
     
     # Use dummy paths if not provided
@@ -111,36 +103,22 @@ def get_all_tool_metadata() -> List[Dict]:
     Returns:
         List of tool metadata dictionaries
     """
-    if not _TOOL_REGISTRY:
-        _discover_tools()
-    
-    # Create dummy instances to get metadata
-    # We use None for paths since we only need metadata
-    metadata_list = []
-    for tool_class in _TOOL_REGISTRY.values():
-        try:
-            # Create a mock instance just to get metadata
-            # We'll handle the AttributeError from None paths
-            try:
-                tool = tool_class(Path("."), Path("."))
-            except:
-                # If initialization fails, try to get metadata directly from class
-                metadata = {
-                    "name": tool_class.name,
-                    "description": tool_class.description,
-                    "parameters": tool_class.parameters,
-                    "returns": tool_class.returns,
-                    "requirements": tool_class.requirements,
-                    "example": tool_class.example
-                }
-                metadata_list.append(metadata)
-                continue
-            
-            metadata_list.append(tool.get_metadata())
-        except Exception as e:
-            print(f"Warning: Failed to get metadata for {tool_class.name}: {str(e)}")
-    
-    return metadata_list
+    global _METADATA_CACHE
+    if _METADATA_CACHE is None:
+        # Metadata lives on the classes, so read it directly instead of
+        # instantiating every tool with dummy paths, and build it only once
+        _METADATA_CACHE = [
+            {
+                "name": tool_class.name,
+                "description": tool_class.description,
+                "parameters": tool_class.parameters,
+                "returns": tool_class.returns,
+                "requirements": tool_class.requirements,
+                "example": tool_class.example
+            }
+            for tool_class in _TOOL_REGISTRY.values()
+        ]
+    return _METADATA_CACHE
 
 
 # Auto-discover tools on import
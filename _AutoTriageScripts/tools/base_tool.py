@@ -10,6 +10,19 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+def _strip_sonar_prefix(file_path: str) -> str:
+    """
+    Strip a SonarQube project prefix (e.g. "AutoTriage:path" → "path").
+
+    partition does the split in one scan without allocating a list, and
+    the separator check only runs on the tail.
+    """
+    head, sep, tail = file_path.partition(':')
+    if sep and ('/' in tail or '\\' in tail):
+        return tail
+    return file_path
+
+
 class BaseTool(ABC):
     """
     Abstract base class for all tools.
@@ -28,7 +41,27 @@ class BaseTool(ABC):
     returns: Dict[str, str] = {}
     requirements: List[Dict[str, Any]] = []
     example: Dict[str, Any] = {}
-    
+
+    # Derived once per subclass by __init_subclass__
+    _required_params: tuple = ()
+    _metadata: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute per-class data so it isn't rebuilt on every call."""
+        super().__init_subclass__(**kwargs)
+        cls._required_params = tuple(
+            name for name, info in cls.parameters.items()
+            if info.get("required", False)
+        )
+        cls._metadata = {
+            "name": cls.name,
+            "description": cls.description,
+            "parameters": cls.parameters,
+            "returns": cls.returns,
+            "requirements": cls.requirements,
+            "example": cls.example
+        }
+
     def __init__(self, workspace_root: Path, input_dir: Path):
         """
         Initialize the tool with workspace paths.
@@ -39,7 +72,12 @@ class BaseTool(ABC):
         """
         self.workspace_root = workspace_root
         self.input_dir = input_dir
-        
+        # Plain-string forms for hot paths: os.path calls on str avoid
+        # pathlib's per-operation object construction and normalization
+        self._workspace_str = str(workspace_root)
+        self._input_str = str(input_dir)
+
+
         # Validate that subclass defined required metadata
         if self.name is None:
             raise ValueError(f"{self.__class__.__name__} must define 'name' class attribute")
@@ -66,14 +104,9 @@ class BaseTool(ABC):
         Returns:
             Dictionary with tool definition
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.parameters,
-            "returns": self.returns,
-            "requirements": self.requirements,
-            "example": self.example
-        }
+        # All fields are class-level constants, so the dict is built once
+        # per subclass rather than per call
+        return self._metadata
     
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """
@@ -85,11 +118,9 @@ class BaseTool(ABC):
         Returns:
             True if valid, False otherwise
         """
-        for param_name, param_info in self.parameters.items():
-            if param_info.get("required", False):
-                if param_name not in params:
-                    return False
-        return True
+        # Required names are precomputed per class, so validation is just
+        # membership checks against the incoming dict
+        return all(name in params for name in self._required_params)
     
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}: {self.name}>"
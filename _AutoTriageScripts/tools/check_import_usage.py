@@ -4,8 +4,10 @@ check_import_usage tool - Check if a Python package is imported in the codebase
 
 from pathlib import Path
 from typing import Dict, Any, List
+import re
 
 from .base_tool import BaseTool
+from .search_code import SearchCodeTool
 
 
 class CheckImportUsageTool(BaseTool):
@@ -42,7 +44,13 @@ class CheckImportUsageTool(BaseTool):
             }
         }
     }
-    
+
+    def __init__(self, workspace_root, input_dir):
+        super().__init__(workspace_root, input_dir)
+        # Bind the search implementation once instead of going through
+        # get_tool's registry lookup and re-instantiation on every call
+        self._search_tool = SearchCodeTool(workspace_root, input_dir)
+
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Check if a Python package is imported anywhere in the codebase."""
         package_name = params.get("package_name")
@@ -51,34 +59,28 @@ class CheckImportUsageTool(BaseTool):
             return {"success": False, "error": "package_name parameter required"}
         
         try:
-            # Import search_code tool dynamically to avoid circular imports
-            from . import get_tool
-            search_code_tool = get_tool("search_code", self.workspace_root, self.input_dir)
-            
-            # Search for import patterns
-            import_patterns = [
-                f"import {package_name}",
-                f"from {package_name}",
-                f"import {package_name}.",  # submodule imports
-            ]
-            
+            # One fused pattern covering 'import pkg', 'import pkg.sub' and
+            # 'from pkg import ...' so the codebase is searched once instead
+            # of once per import style
+            pattern = rf"(^|\s)(import|from)\s+{re.escape(package_name)}(\.|\s|$)"
+
             all_locations = []
             all_patterns_found = []
-            
-            for pattern in import_patterns:
-                # Use search_code tool
-                result = search_code_tool.execute({
-                    "pattern": pattern,
-                    "file_glob": "*.py",
-                    "case_sensitive": False
-                })
-                
-                if result.get("success") and result.get("matches"):
-                    for match in result["matches"]:
-                        location = f"{match['file']}:{match['line_number']}"
-                        if location not in all_locations:
-                            all_locations.append(location)
-                            all_patterns_found.append(match['line_content'])
+            seen_locations = set()
+
+            result = self._search_tool.execute({
+                "pattern": pattern,
+                "file_glob": "*.py",
+                "case_sensitive": True
+            })
+
+            if result.get("success") and result.get("matches"):
+                for match in result["matches"]:
+                    location = f"{match['file']}:{match['line_number']}"
+                    if location not in seen_locations:
+                        seen_locations.add(location)
+                        all_locations.append(location)
+                        all_patterns_found.append(match['line_content'])
             
             return {
                 "success": True,
@@ -95,3 +97,6 @@ class CheckImportUsageTool(BaseTool):
                 "error": str(e)
             }
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = CheckImportUsageTool
@@ -10,9 +10,144 @@ re-analyzing issues that have already been reviewed.
 
 from pathlib import Path
 from typing import Dict, Any
+import functools
+import hashlib
+import json
+import os
+import pickle
+import re
 
 from .base_tool import BaseTool
 
+# Import PyYAML once at module load instead of per execute() call; the
+# tool degrades gracefully when it is missing
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Characters replaced when mapping a problem ID to a filename
+# (CVE:2020:14343 -> CVE-2020-14343 / CVE_2020_14343)
+_SANITIZE_RE = re.compile(r"[:/ ]")
+
+# Cross-process registry of the whole known-issues directory, pickled
+# under the user cache dir and keyed by a fingerprint of every YAML
+# file's (name, mtime, size). A warm process start does one unpickle
+# instead of one parse per issue file.
+_CACHE_DIR = Path.home() / ".cache" / "autotriage"
+
+
+def _fingerprint(known_issues_dir: Path) -> str:
+    """Digest of every issue file's (name, mtime_ns, size), sorted."""
+    entries = []
+    for pattern in ("*.yml", "*.yaml"):
+        for path in known_issues_dir.glob(pattern):
+            if path.name.startswith("."):
+                continue
+            st = path.stat()
+            entries.append((path.name, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return hashlib.sha256(repr(entries).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_registry(dir_str: str, fingerprint: str) -> Dict[str, Any]:
+    """
+    Map issue filenames to parsed documents for a whole directory.
+
+    Served from the pickled registry when its stored fingerprint matches
+    the directory's current one; otherwise rebuilt (via the per-file
+    cache, which may itself hit the JSON sidecars) and re-pickled
+    atomically. Pickle failures degrade to per-file loading.
+    """
+    digest = hashlib.sha256(dir_str.encode()).hexdigest()[:12]
+    cache_file = _CACHE_DIR / f"known_issues-{digest}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            stored_fingerprint, registry = pickle.load(f)
+        if stored_fingerprint == fingerprint:
+            return registry
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass
+
+    registry = {}
+    for path in _issue_index(dir_str, Path(dir_str).stat().st_mtime_ns).values():
+        try:
+            registry[path.name] = _load_yaml(str(path), path.stat().st_mtime_ns)
+        except Exception:
+            continue  # Unparseable file: execute() surfaces the error
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(cache_file.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((fingerprint, registry), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+    return registry
+
+
+@functools.lru_cache(maxsize=8)
+def _issue_index(dir_str: str, mtime_ns: int) -> Dict[str, Path]:
+    """
+    Map lowercased file stems to paths for a known-issues directory.
+
+    Built once per (dir, mtime) so every problem-ID lookup is a dict
+    probe instead of a series of exists() syscalls plus a directory
+    scan. .yml entries are inserted first so a same-stem .yaml wins,
+    matching the old candidate order.
+    """
+    index: Dict[str, Path] = {}
+    for pattern in ("*.yml", "*.yaml"):
+        for path in Path(dir_str).glob(pattern):
+            if not path.name.startswith("."):  # Skip template and examples
+                index[path.stem.lower()] = path
+    return index
+
+
+@functools.lru_cache(maxsize=512)
+def _load_yaml(path_str: str, mtime_ns: int) -> Any:
+    """
+    Parse a known-issue YAML file, cached on (path, mtime).
+
+    Repeat lookups of the same problem hit the cache instead of
+    re-reading and re-parsing; the mtime key invalidates the entry when
+    the file is edited. Uses the C loader when PyYAML was built with it.
+
+    Across processes, a JSON sidecar under the user cache dir holds the
+    parsed document: JSON loads far faster than YAML, so runs after the
+    first skip YAML parsing entirely until the source is edited. Keeping
+    the sidecars in _CACHE_DIR (keyed by a digest of the source path,
+    alongside the pickled registry) leaves the tracked known_issues
+    directory untouched.
+    """
+    digest = hashlib.sha256(path_str.encode()).hexdigest()[:12]
+    sidecar = _CACHE_DIR / f"issue-{digest}.json"
+    try:
+        if sidecar.stat().st_mtime_ns >= mtime_ns:
+            return json.loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or stale/corrupt sidecar: fall through to YAML
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str) as f:
+        data = yaml.load(f, Loader=loader)
+
+    # Refresh the sidecar atomically; failure to write is non-fatal
+    # (read-only home dirs still work, just without the cross-run cache)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError):
+        pass
+
+    return data
+
 
 class CheckKnownIssuesTool(BaseTool):
     """Check if a problem has already been reviewed by humans."""
@@ -69,10 +204,28 @@ class CheckKnownIssuesTool(BaseTool):
         }
     }
     
+    def __init__(self, workspace_root, input_dir):
+        super().__init__(workspace_root, input_dir)
+        # Known issues directory is sibling to tools directory. Resolve it
+        # once and warm the filename index so the first query doesn't pay
+        # the directory scan; the index stays mtime-validated, so edits
+        # made mid-session are still picked up.
+        self._known_issues_dir = (
+            self.workspace_root / "_AutoTriageScripts" / "known_issues"
+        )
+        self._known_issues_str = str(self._known_issues_dir)
+        try:
+            _issue_index(
+                str(self._known_issues_dir),
+                self._known_issues_dir.stat().st_mtime_ns,
+            )
+        except OSError:
+            pass  # Directory absent; execute() reports it per query
+
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Check if a problem has been reviewed by humans.
-        
+
         Args:
             params: Dict with 'problem_id' key
         
@@ -87,10 +240,11 @@ class CheckKnownIssuesTool(BaseTool):
                 "error": "problem_id parameter is required"
             }
         
-        # Known issues directory is sibling to tools directory
-        known_issues_dir = self.workspace_root / "_AutoTriageScripts" / "known_issues"
-        
-        if not known_issues_dir.exists():
+        known_issues_dir = self._known_issues_dir
+
+        # os.path on the precomputed string avoids pathlib overhead on
+        # the per-call check
+        if not os.path.isdir(self._known_issues_str):
             return {
                 "success": True,
                 "found": False,
@@ -107,12 +261,22 @@ class CheckKnownIssuesTool(BaseTool):
                 "message": "No human review found for this issue. Proceed with normal investigation."
             }
         
-        # Load and parse the YAML file
+        if yaml is None:
+            return {
+                "success": False,
+                "error": "PyYAML library not available. Cannot read known issues database."
+            }
+
+        # Serve from the directory registry (one unpickle per warm start),
+        # falling back to the per-file mtime cache
         try:
-            import yaml
-            with open(yaml_file) as f:
-                data = yaml.safe_load(f)
-            
+            registry = _load_registry(
+                str(known_issues_dir), _fingerprint(known_issues_dir)
+            )
+            data = registry.get(yaml_file.name)
+            if data is None:
+                data = _load_yaml(str(yaml_file), yaml_file.stat().st_mtime_ns)
+
             if not data:
                 return {
                     "success": False,
@@ -146,11 +310,6 @@ class CheckKnownIssuesTool(BaseTool):
             
             return response
             
-        except ImportError:
-            return {
-                "success": False,
-                "error": "PyYAML library not available. Cannot read known issues database."
-            }
         except Exception as e:
             return {
                 "success": False,
@@ -169,48 +328,31 @@ class CheckKnownIssuesTool(BaseTool):
         Returns:
             Path to the YAML file, or None if not found
         """
-        # Try exact match first
-        candidates = [
-            f"{problem_id}.yaml",
-            f"{problem_id}.yml",
-        ]
-        
-        # Try with common transformations
-        # CVE:2020:14343 -> CVE-2020-14343
-        sanitized_dash = problem_id.replace(":", "-").replace("/", "-").replace(" ", "-")
-        candidates.extend([
-            f"{sanitized_dash}.yaml",
-            f"{sanitized_dash}.yml",
-        ])
-        
-        # CVE:2020:14343 -> CVE_2020_14343
-        sanitized_underscore = problem_id.replace(":", "_").replace("/", "_").replace(" ", "_")
-        candidates.extend([
-            f"{sanitized_underscore}.yaml",
-            f"{sanitized_underscore}.yml",
-        ])
-        
-        # Try all candidates
-        for candidate in candidates:
-            yaml_file = known_issues_dir / candidate
-            if yaml_file.exists() and not yaml_file.name.startswith("."):
-                return yaml_file
-        
-        # Last resort: case-insensitive search
-        # (for when user creates CVE-2020-14343.yaml but scanner reports cve-2020-14343)
-        problem_id_lower = problem_id.lower()
-        for yaml_file in known_issues_dir.glob("*.yaml"):
-            if yaml_file.name.startswith("."):  # Skip template and examples
-                continue
-            
-            # Extract problem ID from filename (remove .yaml/.yml)
-            file_id = yaml_file.stem.lower()
-            
-            # Check if it matches
-            if file_id == problem_id_lower or \
-               file_id == sanitized_dash.lower() or \
-               file_id == sanitized_underscore.lower():
+        # One cached index of the directory replaces per-candidate
+        # exists() probes and the trailing case-insensitive scan; the
+        # lowercased keys make every lookup case-insensitive
+        # (for when user creates CVE-2020-14343.yaml but scanner reports
+        # cve-2020-14343)
+        try:
+            index = _issue_index(
+                str(known_issues_dir), known_issues_dir.stat().st_mtime_ns
+            )
+        except OSError:
+            return None
+
+        # Try exact match first, then the sanitized variants, built with
+        # one precompiled substitution each instead of chained .replace
+        for candidate in (
+            problem_id,
+            _SANITIZE_RE.sub("-", problem_id),
+            _SANITIZE_RE.sub("_", problem_id),
+        ):
+            yaml_file = index.get(candidate.lower())
+            if yaml_file is not None:
                 return yaml_file
-        
+
         return None
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = CheckKnownIssuesTool
@@ -2,11 +2,74 @@
 find_files tool - Find files matching a pattern
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import functools
+import heapq
+import os
+import re
+import time
 
 from .base_tool import BaseTool
 
+# How long a cached directory walk stays valid. Matches the existence-
+# cache TTL in tool_availability: repeated pattern queries within a
+# burst share one walk, while files created mid-run show up promptly.
+_LISTING_TTL = 2.0
+
+
+@functools.lru_cache(maxsize=128)
+def _glob_match(pattern: str):
+    """
+    Compile a glob to a matcher with Path.rglob semantics, applied to
+    search-dir-relative paths: the pattern may match at any depth, '*'
+    and '?' never cross '/', and '**' spans whole components — so a bare
+    'app.py' finds app.py files anywhere below the search dir, exactly
+    like rglob did.
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i):
+                i += 2
+                if i < n and pattern[i] == '/':
+                    i += 1
+                    out.append(r'(?:[^/]+/)*')
+                else:
+                    out.append(r'.*')
+            else:
+                out.append(r'[^/]*')
+                i += 1
+        elif c == '?':
+            out.append(r'[^/]')
+            i += 1
+        elif c == '[':
+            # Copy a character class through, fnmatch-style
+            j = i + 1
+            if j < n and pattern[j] in '!]':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                out.append(r'\[')
+                i += 1
+            else:
+                inner = pattern[i + 1:j].replace('\\', r'\\')
+                if inner.startswith('!'):
+                    inner = '^' + inner[1:]
+                out.append('[' + inner + ']')
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+
+    # rglob(pattern) behaves like glob('**/' + pattern): any number of
+    # leading components may precede the match
+    return re.compile(r'(?:[^/]+/)*' + ''.join(out)).fullmatch
+
 
 class FindFilesTool(BaseTool):
     """Find files matching a pattern."""
@@ -26,6 +89,11 @@ class FindFilesTool(BaseTool):
             "description": "Directory to search in (relative to workspace root). Default: '.'",
             "required": False,
             "default": "."
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of files to return (first N in sorted order). Default: no limit",
+            "required": False
         }
     }
     
@@ -38,6 +106,13 @@ class FindFilesTool(BaseTool):
     }
     
     requirements = []  # No special requirements
+
+    # Cache of walked directory listings (workspace-relative file paths)
+    # keyed by absolute search dir, so repeated queries with different
+    # patterns share one walk instead of re-walking per rglob call.
+    # Entries carry their walk timestamp and expire on _LISTING_TTL so
+    # files created or deleted mid-run are picked up.
+    _dir_listing_cache: Dict[str, Tuple[float, List[str]]] = {}
     
     example = {
         "call": {
@@ -53,35 +128,72 @@ class FindFilesTool(BaseTool):
         """Find files matching a pattern."""
         pattern = params.get("pattern")
         directory = params.get("directory", ".")
-        
+        limit = params.get("limit")
+
         if not pattern:
             return {"success": False, "error": "pattern parameter required"}
         
         try:
-            search_dir = self.workspace_root / directory
-            
-            if not search_dir.exists():
+            # normpath keeps '.'/'./' segments out of the walked paths so
+            # the returned paths stay cleanly workspace-relative
+            search_dir = os.path.normpath(os.path.join(self._workspace_str, directory))
+
+            # The tool only exposes the workspace being analyzed: an
+            # absolute directory discards the join base and '..' climbs
+            # above the root, so reject anything resolving outside it
+            root = os.path.normpath(self._workspace_str)
+            if search_dir != root and not search_dir.startswith(root + os.sep):
+                return {
+                    "success": False,
+                    "pattern": pattern,
+                    "error": f"Directory is outside the workspace: {directory}"
+                }
+
+            if not os.path.isdir(search_dir):
                 return {
                     "success": False,
                     "pattern": pattern,
                     "error": f"Directory not found: {directory}"
                 }
             
-            # Use glob to find matching files
-            matches = []
-            for filepath in search_dir.rglob(pattern):
-                if filepath.is_file():
-                    rel_path = filepath.relative_to(self.workspace_root)
-                    # Skip _AutoTriageScripts directory
-                    if rel_path.parts[0] == "_AutoTriageScripts":
-                        continue
-                    matches.append(str(rel_path))
-            
+            # Match the pattern in-memory against the cached walk listing,
+            # with the glob→regex translation compiled once per pattern.
+            # The listing holds workspace-relative paths; matching runs on
+            # the search-dir-relative tail so `directory` scopes the
+            # pattern the way rglob's search root did.
+            match = _glob_match(pattern)
+            norm = os.path.normpath(directory).replace(os.sep, "/")
+
+            # The tool code itself is never searched: the walk prunes
+            # _AutoTriageScripts subdirectories, and a search rooted at
+            # (or inside) it must come back empty for the same reason
+            if norm == "_AutoTriageScripts" or norm.startswith("_AutoTriageScripts/"):
+                return {
+                    "success": True,
+                    "pattern": pattern,
+                    "files": [],
+                    "count": 0
+                }
+
+            sublen = 0 if norm == "." else len(norm) + 1
+            matches = [
+                path for path in self._list_all(search_dir)
+                if match(path[sublen:])
+            ]
+            count = len(matches)
+
+            # With a limit, take the first N in sorted order via a bounded
+            # heap (O(n log k)) instead of fully sorting the list
+            if limit is not None:
+                matches = heapq.nsmallest(limit, matches)
+            else:
+                matches.sort()
+
             return {
                 "success": True,
                 "pattern": pattern,
-                "files": sorted(matches),
-                "count": len(matches)
+                "files": matches,
+                "count": count
             }
         
         except Exception as e:
@@ -91,3 +203,61 @@ class FindFilesTool(BaseTool):
                 "error": str(e)
             }
 
+    def _list_all(self, search_dir: str) -> List[str]:
+        """
+        Return all workspace-relative file paths under a directory,
+        walking the tree only on a cache miss or an expired entry.
+        """
+        now = time.monotonic()
+        cached = self._dir_listing_cache.get(search_dir)
+        if cached is not None and (now - cached[0]) < _LISTING_TTL:
+            return cached[1]
+
+        # Parallel os.scandir traversal: DirEntry carries the file type
+        # from the directory read, so no per-entry stat is needed, and
+        # scandir releases the GIL, so a thread pool overlaps readdir
+        # latency across directories (a real win on cold caches and
+        # network filesystems). Every discovered path sits under the
+        # workspace, so relative paths are a constant-prefix slice rather
+        # than os.path.relpath's component-wise comparison.
+        prefix = self._workspace_str.rstrip(os.sep) + os.sep
+        plen = len(prefix)
+
+        def scan(current: str) -> Tuple[List[str], List[str]]:
+            files: List[str] = []
+            subdirs: List[str] = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip _AutoTriageScripts (prune before descending)
+                            if entry.name != "_AutoTriageScripts":
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            path = entry.path
+                            files.append(
+                                path[plen:] if path.startswith(prefix)
+                                else os.path.relpath(path, prefix)
+                            )
+            except (PermissionError, FileNotFoundError):
+                pass
+            return files, subdirs
+
+        listing: List[str] = []
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(scan, search_dir)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    listing.extend(files)
+                    for subdir in subdirs:
+                        pending.add(executor.submit(scan, subdir))
+
+        self._dir_listing_cache[search_dir] = (now, listing)
+        return listing
+
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = FindFilesTool
@@ -4,6 +4,8 @@ list_directory tool - List files and directories in a directory
 
 from pathlib import Path
 from typing import Dict, Any, List
+import heapq
+import os
 
 from .base_tool import BaseTool
 
@@ -27,6 +29,11 @@ class ListDirectoryTool(BaseTool):
             "description": "Whether to recursively list subdirectories. Default: false",
             "required": False,
             "default": False
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of files/directories to return (first N in sorted order). Default: no limit",
+            "required": False
         }
     }
     
@@ -54,18 +61,30 @@ class ListDirectoryTool(BaseTool):
         """List files and directories in a directory."""
         directory = params.get("directory", ".")
         recursive = params.get("recursive", False)
-        
+        limit = params.get("limit")
+
         try:
-            dir_path = self.workspace_root / directory
-            
-            if not dir_path.exists():
+            dir_path = os.path.normpath(os.path.join(self._workspace_str, directory))
+
+            # The tool only exposes the workspace being analyzed: an
+            # absolute directory discards the join base and '..' climbs
+            # above the root, so reject anything resolving outside it
+            root = os.path.normpath(self._workspace_str)
+            if dir_path != root and not dir_path.startswith(root + os.sep):
+                return {
+                    "success": False,
+                    "directory": directory,
+                    "error": f"Directory is outside the workspace: {directory}"
+                }
+
+            if not os.path.exists(dir_path):
                 return {
                     "success": False,
                     "directory": directory,
                     "error": "Directory not found"
                 }
-            
-            if not dir_path.is_dir():
+
+            if not os.path.isdir(dir_path):
                 return {
                     "success": False,
                     "directory": directory,
@@ -74,27 +93,45 @@ class ListDirectoryTool(BaseTool):
             
             files = []
             directories = []
+
+            # os.scandir returns the entry type from the directory read
+            # itself, so no extra stat per entry (unlike Path.iterdir/rglob
+            # which build a Path and stat each item). Paths are made
+            # workspace-relative by slicing off the constant prefix instead
+            # of calling os.path.relpath per entry.
+            prefix = self._workspace_str.rstrip(os.sep) + os.sep
+            plen = len(prefix)
+            pending = [dir_path]
+            while pending:
+                current = pending.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        path = entry.path
+                        rel_path = (
+                            path[plen:] if path.startswith(prefix)
+                            else os.path.relpath(path, prefix)
+                        )
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(rel_path)
+                            if recursive:
+                                pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(rel_path)
             
-            if recursive:
-                for item in dir_path.rglob('*'):
-                    rel_path = str(item.relative_to(self.workspace_root))
-                    if item.is_file():
-                        files.append(rel_path)
-                    elif item.is_dir():
-                        directories.append(rel_path)
+            # With a limit, take the first N in sorted order via a bounded
+            # heap (O(n log k)) instead of fully sorting each list
+            if limit is not None:
+                files = heapq.nsmallest(limit, files)
+                directories = heapq.nsmallest(limit, directories)
             else:
-                for item in dir_path.iterdir():
-                    rel_path = str(item.relative_to(self.workspace_root))
-                    if item.is_file():
-                        files.append(rel_path)
-                    elif item.is_dir():
-                        directories.append(rel_path)
-            
+                files.sort()
+                directories.sort()
+
             return {
                 "success": True,
                 "directory": directory,
-                "files": sorted(files),
-                "directories": sorted(directories)
+                "files": files,
+                "directories": directories
             }
         
         except Exception as e:
@@ -104,3 +141,6 @@ class ListDirectoryTool(BaseTool):
                 "error": str(e)
             }
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = ListDirectoryTool
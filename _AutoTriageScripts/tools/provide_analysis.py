@@ -107,3 +107,6 @@ class ProvideAnalysisTool(BaseTool):
         """
         return {"status": "analysis_complete"}
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = ProvideAnalysisTool
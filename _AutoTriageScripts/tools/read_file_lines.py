@@ -6,9 +6,27 @@ Reads a specific range of lines from a file (useful for large files).
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from stat import S_ISREG
+from typing import Dict, Any, List
+import functools
+import os
 
-from .base_tool import BaseTool
+from .base_tool import BaseTool, _strip_sonar_prefix
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_lines(path: str, mtime_ns: int) -> List[str]:
+    """
+    Lines of a file, keyed on (path, mtime).
+
+    Agents tend to re-read the same file in several ranges; the first
+    request pays the full read and every later range is a list slice.
+    The mtime key makes edits show up as a fresh entry. Decoding uses
+    errors='ignore' so non-UTF-8 files return best-effort content, the
+    same tolerance read_file applies.
+    """
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.readlines()
 
 
 class ReadFileLinesTool(BaseTool):
@@ -71,31 +89,25 @@ class ReadFileLinesTool(BaseTool):
                 "error": "file_path, start_line, and end_line parameters required"
             }
         
-        # Strip SonarQube project prefix
-        if ':' in file_path and ('/' in file_path or '\\' in file_path):
-            file_path = file_path.split(':', 1)[1]
+        file_path = _strip_sonar_prefix(file_path)
         
         try:
             full_path = self.workspace_root / file_path
-            
-            if not full_path.exists():
-                return {
-                    "success": False,
-                    "file_path": file_path,
-                    "error": "File not found"
-                }
-            
-            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-            
-            total_lines = len(all_lines)
-            
+
             # Convert to 0-indexed for Python
             start_idx = max(0, start_line - 1)
-            end_idx = min(total_lines, end_line)
-            
-            selected_lines = all_lines[start_idx:end_idx]
-            content = ''.join(selected_lines)
+            end_idx = max(start_idx, end_line)
+
+            # One stat gives both the existence check and the cache key;
+            # repeated ranges over the same file then slice the cached
+            # line list instead of re-reading it
+            st = os.stat(full_path)
+            if not S_ISREG(st.st_mode):
+                raise IsADirectoryError(str(full_path))
+
+            lines = _cached_lines(str(full_path), st.st_mtime_ns)
+            total_lines = len(lines)
+            content = ''.join(lines[start_idx:end_idx])
             
             return {
                 "success": True,
@@ -105,7 +117,13 @@ class ReadFileLinesTool(BaseTool):
                 "content": content,
                 "total_lines": total_lines
             }
-        
+
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return {
+                "success": False,
+                "file_path": file_path,
+                "error": "File not found"
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -113,3 +131,6 @@ class ReadFileLinesTool(BaseTool):
                 "error": str(e)
             }
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = ReadFileLinesTool
@@ -2,14 +2,145 @@
 search_code tool - Search for patterns in codebase using grep
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import fnmatch
+import functools
+import mmap
+import os
+import shutil
 import subprocess
+import sys
+import threading
+import time
 import re
 
 from .base_tool import BaseTool
 
 
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int) -> "re.Pattern":
+    """Compile a search regex once per (pattern, flags) for repeated queries."""
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_bytes(pattern: str, flags: int) -> "re.Pattern":
+    """Bytes-level variant of _compiled, for scanning without decoding."""
+    return re.compile(pattern.encode('utf-8'), flags)
+
+
+@functools.lru_cache(maxsize=128)
+def _glob_regex(pattern: str) -> "re.Pattern":
+    """Compile a glob's fnmatch translation once instead of per filename."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _scan_file(path: str, rel_path: str, bregex: "re.Pattern") -> List[Dict[str, Any]]:
+    """
+    Scan one file with a bytes regex over an mmap of its contents.
+
+    Module-level (not a method) so process-pool workers can run it
+    without pickling a tool instance. Returns at most
+    _MAX_MATCHES_PER_FILE match dicts; unreadable files yield none.
+    """
+    matches: List[Dict[str, Any]] = []
+    try:
+        with open(path, 'rb') as fb:
+            # Cheap binary sniff on the first block, mirroring grep's
+            # --binary-files=without-match
+            if b'\x00' in fb.read(8192):
+                return matches
+
+            # Map the file and run one finditer over the whole buffer:
+            # no per-line str objects, and the line number comes from a
+            # running newline count so the total cost stays O(filesize)
+            try:
+                mm = mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return matches  # Empty file
+            with mm:
+                line_num = 1
+                cursor = 0
+                prev_line_start = -1
+                for m in bregex.finditer(mm):
+                    start = m.start()
+                    line_num += mm[cursor:start].count(b'\n')
+                    cursor = start
+                    line_start = mm.rfind(b'\n', 0, start) + 1
+                    if line_start == prev_line_start:
+                        # Report each line once, like grep
+                        continue
+                    prev_line_start = line_start
+                    line_end = mm.find(b'\n', m.end())
+                    if line_end == -1:
+                        line_end = len(mm)
+                    matches.append({
+                        "file": rel_path,
+                        "line_number": line_num,
+                        "line_content": mm[line_start:line_end]
+                        .strip().decode('utf-8', 'replace')
+                    })
+                    if len(matches) >= _MAX_MATCHES_PER_FILE:
+                        break
+    except Exception:
+        pass
+    return matches
+
+
+def _scan_chunk(
+    pattern: str, flags: int, chunk: List[Tuple[str, str]]
+) -> List[Dict[str, Any]]:
+    """Process-pool worker: scan a batch of (path, rel_path) pairs."""
+    bregex = _compiled_bytes(pattern, flags)
+    matches: List[Dict[str, Any]] = []
+    for path, rel_path in chunk:
+        matches.extend(_scan_file(path, rel_path, bregex))
+        if len(matches) >= _MAX_TOTAL_MATCHES:
+            break
+    return matches
+
+# Matches one grep output line: filepath:line_number:content, with
+# surrounding whitespace trimmed by the groups themselves so the parser
+# never needs a separate strip() pass
+_GREP_LINE_RE = re.compile(rb"^([^:\n]+):(\d+):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+# Directories that never contain interesting workspace code; excluding them
+# keeps grep (and the Python fallback) from chewing through VCS metadata,
+# vendored packages and caches
+_EXCLUDED_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__"}
+
+# Extensions that are always binary; skipping them by name saves even
+# opening the file, before the content sniff in _scan_file gets a say
+_BIN_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.pdf',
+    '.zip', '.gz', '.tar', '.bz2', '.xz', '.7z', '.whl',
+    '.so', '.dll', '.exe', '.o', '.a', '.class', '.jar', '.wasm',
+    '.pyc', '.woff', '.woff2', '.ttf', '.eot',
+})
+
+# Per-file cap on matches so a pathological pattern can't produce an
+# unbounded result for the agent to parse
+_MAX_MATCHES_PER_FILE = 1000
+
+# Overall cap across all files, bounding memory for repo-wide patterns
+_MAX_TOTAL_MATCHES = 10000
+
+# Subprocess search time budget in seconds
+_SEARCH_TIMEOUT = 30
+
+# How long a cached candidate walk stays valid. Matches the listing TTL
+# in find_files: repeated pattern variants within a burst share one
+# walk, while files created mid-run show up promptly.
+_CANDIDATE_TTL = 2.0
+
+# Prefer ripgrep when installed: its SIMD literal matcher is much faster
+# than grep -E on large trees, and it emits the same file:line:content
+# format with -n --no-heading. Resolved once at import.
+_RG = shutil.which("rg")
+
+
 class SearchCodeTool(BaseTool):
     """Search for a pattern in the codebase using grep."""
     
@@ -46,6 +177,14 @@ class SearchCodeTool(BaseTool):
     }
     
     requirements = []  # No requirements, grep fallback to Python if not available
+
+    # Cache of candidate file lists for the in-process fallback, keyed by
+    # (workspace_root, glob). Shared across instances so consecutive
+    # searches (e.g. check_import_usage's pattern variants) walk the tree
+    # once instead of once per pattern. Entries carry their walk
+    # timestamp and expire on _CANDIDATE_TTL so files created or deleted
+    # mid-run are picked up.
+    _candidate_cache: Dict[tuple, Tuple[float, List[Path]]] = {}
     
     example = {
         "call": {
@@ -68,50 +207,100 @@ class SearchCodeTool(BaseTool):
             return {"success": False, "error": "pattern parameter required"}
         
         try:
-            # Use grep (available on Linux/GitHub Actions)
-            cmd = ["grep", "-r", "-n"]  # recursive, line numbers
-            
-            if not case_sensitive:
-                cmd.append("-i")  # case insensitive
-            
-            cmd.extend(["-E", pattern])  # extended regex
-            
-            # Add file glob if specified
-            if file_glob and file_glob != "*":
-                cmd.extend(["--include", file_glob])
-            
-            # Exclude _AutoTriageScripts directory to avoid searching tool code
-            cmd.extend(["--exclude-dir", "_AutoTriageScripts"])
-            
+            if _RG:
+                cmd = [_RG, "-n", "--no-heading"]
+
+                if not case_sensitive:
+                    cmd.append("-i")
+
+                # Add file glob if specified
+                if file_glob and file_glob != "*":
+                    cmd.extend(["-g", file_glob])
+
+                # Exclude _AutoTriageScripts and vendored/VCS directories
+                # (ripgrep skips binaries and respects .gitignore itself)
+                cmd.extend(["-g", "!_AutoTriageScripts"])
+                for excluded in sorted(_EXCLUDED_DIRS):
+                    cmd.extend(["-g", f"!{excluded}"])
+                cmd.append(f"--max-count={_MAX_MATCHES_PER_FILE}")
+
+                cmd.extend(["-e", pattern])
+            else:
+                # Use grep (available on Linux/GitHub Actions)
+                cmd = ["grep", "-r", "-n"]  # recursive, line numbers
+
+                if not case_sensitive:
+                    cmd.append("-i")  # case insensitive
+
+                cmd.extend(["-E", pattern])  # extended regex
+
+                # Add file glob if specified
+                if file_glob and file_glob != "*":
+                    cmd.extend(["--include", file_glob])
+
+                # Exclude _AutoTriageScripts directory to avoid searching tool code
+                cmd.extend(["--exclude-dir", "_AutoTriageScripts"])
+
+                # Skip vendored/VCS directories and binary files, and bound the
+                # per-file match count so output parsing stays cheap
+                for excluded in sorted(_EXCLUDED_DIRS):
+                    cmd.append(f"--exclude-dir={excluded}")
+                cmd.append("--binary-files=without-match")
+                cmd.append(f"--max-count={_MAX_MATCHES_PER_FILE}")
+
             cmd.append(str(self.workspace_root))
-            
-            result = subprocess.run(
+
+            # Stream the subprocess output line by line instead of
+            # buffering it all: peak memory stays at one line plus the
+            # kept matches, and the overall cap can stop the search
+            # without waiting for the full walk to finish
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
             )
-            
             matches = []
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if ':' in line:
-                        # Format: filepath:line_number:content
-                        parts = line.split(':', 2)
-                        if len(parts) >= 3:
-                            filepath = parts[0]
-                            # Make path relative to workspace
-                            try:
-                                rel_path = Path(filepath).relative_to(self.workspace_root)
-                            except ValueError:
-                                rel_path = filepath
-                            
-                            matches.append({
-                                "file": str(rel_path),
-                                "line_number": int(parts[1]) if parts[1].isdigit() else 0,
-                                "line_content": parts[2].strip()
-                            })
-            
+            deadline = time.monotonic() + _SEARCH_TIMEOUT
+            # The per-line deadline check only fires between lines; a
+            # search that stalls inside a blocking read (e.g. grep stuck
+            # on a pipe or slow filesystem with no output yet) would hang
+            # forever. The watchdog kills the process at the deadline,
+            # which unblocks the read with EOF.
+            watchdog = threading.Timer(_SEARCH_TIMEOUT, proc.kill)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                # Make paths relative to workspace with a bytes prefix strip
+                prefix = (str(self.workspace_root).rstrip(os.sep) + os.sep).encode()
+                prefix_len = len(prefix)
+                for line in proc.stdout:
+                    if time.monotonic() > deadline:
+                        raise subprocess.TimeoutExpired(cmd, _SEARCH_TIMEOUT)
+                    m = _GREP_LINE_RE.match(line)
+                    if m is None:
+                        continue
+                    filepath = m.group(1)
+                    if filepath.startswith(prefix):
+                        filepath = filepath[prefix_len:]
+                    matches.append({
+                        # Interning dedupes the repeated path strings that
+                        # large per-file match sets would otherwise hold
+                        "file": sys.intern(filepath.decode('utf-8', 'replace')),
+                        "line_number": int(m.group(2)),
+                        "line_content": m.group(3).decode('utf-8', 'replace')
+                    })
+                    if len(matches) >= _MAX_TOTAL_MATCHES:
+                        break
+                else:
+                    # EOF: if the watchdog killed the process, report the
+                    # timeout rather than a truncated success
+                    if time.monotonic() > deadline:
+                        raise subprocess.TimeoutExpired(cmd, _SEARCH_TIMEOUT)
+            finally:
+                watchdog.cancel()
+                proc.kill()
+                proc.wait()
+
             return {
                 "success": True,
                 "pattern": pattern,
@@ -139,45 +328,48 @@ class SearchCodeTool(BaseTool):
         """Fallback Python implementation of code search."""
         try:
             flags = 0 if case_sensitive else re.IGNORECASE
-            regex = re.compile(pattern, flags)
-            
-            matches = []
-            
-            # Search in files matching glob
-            if file_glob == "*":
-                search_pattern = "**/*"
-            else:
-                search_pattern = f"**/{file_glob}"
-            
-            for filepath in self.workspace_root.glob(search_pattern):
-                if filepath.is_file():
-                    # Skip _AutoTriageScripts directory
-                    try:
-                        rel_path = filepath.relative_to(self.workspace_root)
-                        if rel_path.parts[0] == "_AutoTriageScripts":
-                            continue
-                    except (ValueError, IndexError):
-                        pass
-                    
-                    try:
-                        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                            for line_num, line in enumerate(f, 1):
-                                if regex.search(line):
-                                    matches.append({
-                                        "file": str(filepath.relative_to(self.workspace_root)),
-                                        "line_number": line_num,
-                                        "line_content": line.strip()
-                                    })
-                    except Exception:
-                        continue
-            
+            regex = _compiled(pattern, flags)
+
+            # Prefer a bytes pattern: the whole mapped file is scanned in
+            # one C-level finditer pass and only matching lines are
+            # decoded. MULTILINE keeps ^/$ anchored per line, as they
+            # were when scanning line by line. Patterns the bytes engine
+            # can't express fall back to str.
+            try:
+                bregex = _compiled_bytes(pattern, flags | re.MULTILINE)
+            except (re.error, ValueError):
+                bregex = None
+
+            candidates = self._candidate_files(file_glob)
+
+            # On big candidate sets with a bytes pattern, fan out across
+            # processes: the regex engine holds the GIL while matching,
+            # so true parallelism needs separate interpreters. Small sets
+            # (or failures to fork) use the thread pool, which still
+            # overlaps the per-file syscall latency.
+            matches = None
+            if bregex is not None and len(candidates) > 50:
+                matches = self._scan_with_processes(
+                    pattern, flags | re.MULTILINE, candidates
+                )
+
+            if matches is None:
+                matches = []
+                max_workers = min(32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for file_matches in executor.map(
+                        lambda filepath: self._grep_file(filepath, regex, bregex),
+                        candidates
+                    ):
+                        matches.extend(file_matches)
+
             return {
                 "success": True,
                 "pattern": pattern,
                 "matches": matches,
                 "match_count": len(matches)
             }
-        
+
         except Exception as e:
             return {
                 "success": False,
@@ -185,3 +377,118 @@ class SearchCodeTool(BaseTool):
                 "error": f"Python search failed: {str(e)}"
             }
 
+    def _candidate_files(self, file_glob: str) -> List[Path]:
+        """
+        Return the files to scan for a glob, walking the tree only on a
+        cache miss or an expired entry.
+        """
+        cache_key = (str(self.workspace_root), file_glob)
+        now = time.monotonic()
+        cached = self._candidate_cache.get(cache_key)
+        if cached is not None and (now - cached[0]) < _CANDIDATE_TTL:
+            return cached[1]
+
+        # os.walk avoids the per-entry stat of glob's is_file checks;
+        # excluded directories are pruned before they are descended into.
+        # The glob is translated to a compiled regex once rather than
+        # re-translated by fnmatch.fnmatch for every filename.
+        name_match = None if file_glob == "*" else _glob_regex(file_glob).match
+        candidates = []
+        for root, dirs, files in os.walk(self.workspace_root):
+            dirs[:] = [
+                d for d in dirs
+                if d != "_AutoTriageScripts" and d not in _EXCLUDED_DIRS
+            ]
+            for name in files:
+                if os.path.splitext(name)[1].lower() in _BIN_EXTS:
+                    continue
+                if name_match is None or name_match(name):
+                    candidates.append(Path(root) / name)
+
+        self._candidate_cache[cache_key] = (now, candidates)
+        return candidates
+
+    def _scan_with_processes(
+        self,
+        pattern: str,
+        flags: int,
+        candidates: List[Path],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scan candidates across a process pool, or None on failure.
+
+        Files are partitioned into one chunk per core by cumulative size
+        so workers finish together instead of one core drawing all the
+        large files.
+        """
+        try:
+            prefix_len = len(str(self.workspace_root).rstrip(os.sep) + os.sep)
+            sized = []
+            for filepath in candidates:
+                path = str(filepath)
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    continue
+                sized.append((size, path, sys.intern(path[prefix_len:])))
+
+            # Greedy bin packing: biggest file to the least-loaded chunk
+            workers = min(os.cpu_count() or 1, len(sized)) or 1
+            chunks: List[List[Tuple[str, str]]] = [[] for _ in range(workers)]
+            loads = [0] * workers
+            for size, path, rel_path in sorted(sized, reverse=True):
+                target = loads.index(min(loads))
+                chunks[target].append((path, rel_path))
+                loads[target] += size
+
+            matches: List[Dict[str, Any]] = []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk_matches in executor.map(
+                    _scan_chunk,
+                    [pattern] * workers,
+                    [flags] * workers,
+                    chunks,
+                ):
+                    matches.extend(chunk_matches)
+            return matches[:_MAX_TOTAL_MATCHES]
+        except Exception:
+            # Fork/pickle not available here; caller uses the thread pool
+            return None
+
+    def _grep_file(
+        self,
+        filepath: Path,
+        regex: "re.Pattern",
+        bregex: Optional["re.Pattern"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Scan a single file for regex matches (worker for the thread pool)."""
+        rel_path = sys.intern(str(filepath.relative_to(self.workspace_root)))
+
+        if bregex is not None:
+            return _scan_file(str(filepath), rel_path, bregex)
+
+        matches = []
+        try:
+            with open(filepath, 'rb') as fb:
+                # Cheap binary sniff on the first block, mirroring grep's
+                # --binary-files=without-match
+                if b'\x00' in fb.read(8192):
+                    return matches
+
+            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                for line_num, line in enumerate(f, 1):
+                    if regex.search(line):
+                        matches.append({
+                            "file": rel_path,
+                            "line_number": line_num,
+                            "line_content": line.strip()
+                        })
+                        if len(matches) >= _MAX_MATCHES_PER_FILE:
+                            break
+        except Exception:
+            pass
+        return matches
+
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = SearchCodeTool
@@ -9,12 +9,211 @@ IMPORTANT: Call this tool FIRST before any other investigation to find if humans
 have reviewed similar or related issues.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+import os
 import re
 
 from .base_tool import BaseTool
 
+# Import PyYAML once at module load instead of per execute() call; the
+# tool degrades gracefully when it is missing
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Resolve the loader once: CSafeLoader (libyaml) parses 5-10x faster
+# than the pure-Python SafeLoader. Say so once if only the slow path is
+# available, since this tool runs first in every investigation.
+if yaml is not None:
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+    if _YAML_LOADER is None:
+        _YAML_LOADER = yaml.SafeLoader
+        print("Note: libyaml bindings unavailable; known-issue parsing "
+              "falls back to the pure-Python YAML loader")
+else:
+    _YAML_LOADER = None
+
+class _IssueEntry(NamedTuple):
+    """Parsed issue plus its lowercased fields, precomputed once."""
+    data: Dict[str, Any]
+    problem_id_l: str
+    title_l: str
+    reasoning_l: str
+    context_l: str
+    evidence_l: str
+    status_l: str
+    all_l: str
+
+
+# Parsed known-issue files keyed by path, validated against (mtime_ns,
+# size). A triage run queries the same bounded set of files once per
+# problem; with the cache each file is parsed — and its searchable text
+# lowercased — once per edit instead of once per query term.
+_KI_CACHE: Dict[str, Tuple[int, int, Optional[_IssueEntry]]] = {}
+
+_WORD_RE = re.compile(r"[a-z0-9_.-]+")
+
+# Per-directory inverted index: fingerprint of the directory listing ->
+# (vocab word -> set of issue paths, path -> parsed entry). Queries then
+# only score the issues that share at least one vocabulary word with a
+# search term instead of scanning every file.
+_KI_INDEX: Dict[str, Tuple[tuple, Dict[str, set], Dict[str, _IssueEntry]]] = {}
+
+
+def _directory_index(
+    known_issues_dir: Path,
+) -> Tuple[Dict[str, set], Dict[str, _IssueEntry]]:
+    """
+    Build (or reuse) the inverted word index for a known-issues directory.
+
+    The index is validated against a fingerprint of (name, mtime, size)
+    for every issue file, so edits and additions trigger a rebuild while
+    repeated queries hit the cached structure.
+    """
+    dir_key = str(known_issues_dir)
+    listing = []
+    for entry in os.scandir(known_issues_dir):
+        if not entry.name.endswith(".yaml") or entry.name.startswith((".", "_")):
+            continue
+        st = entry.stat()
+        listing.append((entry.path, st))
+    fingerprint = tuple(
+        (path, st.st_mtime_ns, st.st_size) for path, st in sorted(listing)
+    )
+
+    cached = _KI_INDEX.get(dir_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1], cached[2]
+
+    # Warm the parse cache for misses in a thread pool: cold-cache file
+    # reads overlap on I/O, and CSafeLoader lets libyaml run while other
+    # threads are in syscalls. Warm entries skip the pool entirely.
+    misses = []
+    for path, st in listing:
+        cached_entry = _KI_CACHE.get(path)
+        if (cached_entry is None or cached_entry[0] != st.st_mtime_ns
+                or cached_entry[1] != st.st_size):
+            misses.append((path, st))
+    if len(misses) > 1:
+        def _warm(args):
+            try:
+                _load_issue(*args)
+            except Exception:
+                pass
+        workers = min(16, (os.cpu_count() or 1) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_warm, misses))
+
+    vocab: Dict[str, set] = {}
+    entries: Dict[str, _IssueEntry] = {}
+    for path, st in listing:
+        try:
+            issue = _load_issue(path, st)
+        except Exception:
+            continue
+        if issue is None or not issue.data:
+            continue
+        entries[path] = issue
+        for word in set(_WORD_RE.findall(issue.all_l)):
+            vocab.setdefault(word, set()).add(path)
+
+    _KI_INDEX[dir_key] = (fingerprint, vocab, entries)
+    return vocab, entries
+
+
+def _candidate_paths(
+    vocab: Dict[str, set],
+    entries: Dict[str, _IssueEntry],
+    search_terms: List[str],
+    problem_id: Optional[str],
+) -> set:
+    """
+    Paths that can possibly score above zero for this query.
+
+    Term matching is substring-based, so a query word selects every
+    vocabulary word containing it; multi-word phrases intersect their
+    per-word candidates since a phrase hit needs all of its words.
+    """
+    candidates: set = set()
+    for term in search_terms:
+        words = _WORD_RE.findall(term.lower())
+        if not words:
+            continue
+        term_paths: Optional[set] = None
+        for word in words:
+            word_paths: set = set()
+            for vocab_word, paths in vocab.items():
+                if word in vocab_word:
+                    word_paths |= paths
+            term_paths = word_paths if term_paths is None else term_paths & word_paths
+            if not term_paths:
+                break
+        if term_paths:
+            candidates |= term_paths
+
+    # ID matching and the status bonus are substring checks on single
+    # fields; run them against the (cheap, already-lowercased) entries
+    # rather than trying to express them through the word index
+    if problem_id:
+        query_id = problem_id.lower()
+        variations = (
+            query_id,
+            query_id.replace(":", "-"),
+            query_id.replace(":", "_"),
+            query_id.replace("/", "-"),
+        )
+        for path, issue in entries.items():
+            if path in candidates:
+                continue
+            file_id = issue.problem_id_l
+            if file_id and any(v in file_id or file_id in v for v in variations):
+                candidates.add(path)
+
+    lowered_terms = [term.lower() for term in search_terms]
+    status_words = ("false", "positive", "not applicable", "accept", "risk",
+                    "known risk", "mitigate", "fix", "workaround")
+    if any(sw in term for term in lowered_terms for sw in status_words):
+        for path, issue in entries.items():
+            if issue.status_l:
+                candidates.add(path)
+
+    return candidates
+
+
+def _build_entry(data: Any) -> Optional[_IssueEntry]:
+    """Precompute the lowercase search fields for one parsed issue."""
+    if not isinstance(data, dict):
+        return None
+    problem_id_l = str(data.get("problem_id", "")).lower()
+    title_l = str(data.get("title", "")).lower()
+    reasoning_l = str(data.get("human_reasoning", "")).lower()
+    context_l = " ".join(data.get("context", [])).lower()
+    evidence_l = " ".join(data.get("evidence", [])).lower()
+    status_l = str(data.get("status", "")).lower()
+    all_l = " ".join(
+        (problem_id_l, title_l, reasoning_l, context_l, evidence_l, status_l)
+    )
+    return _IssueEntry(
+        data, problem_id_l, title_l, reasoning_l, context_l, evidence_l,
+        status_l, all_l
+    )
+
+
+def _load_issue(path: str, st: os.stat_result) -> Optional[_IssueEntry]:
+    """Parse one issue file through the (mtime, size)-validated cache."""
+    cached = _KI_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    entry = _build_entry(data)
+    _KI_CACHE[path] = (st.st_mtime_ns, st.st_size, entry)
+    return entry
+
 
 class SearchKnownIssuesTool(BaseTool):
     """Search for related human reviews using keywords."""
@@ -116,59 +315,43 @@ class SearchKnownIssuesTool(BaseTool):
                 "message": "Known issues database not initialized. Proceed with normal investigation."
             }
         
-        # Search all YAML files
-        matches = []
-        
-        try:
-            import yaml
-        except ImportError:
+        if yaml is None:
             return {
                 "success": False,
                 "error": "PyYAML library not available. Cannot search known issues database."
             }
-        
-        for yaml_file in known_issues_dir.glob("*.yaml"):
-            # Skip template and hidden files
-            if yaml_file.name.startswith(".") or yaml_file.name.startswith("_"):
-                continue
-            
-            try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
-                
-                if not data:
-                    continue
-                
-                # Calculate relevance score
-                score, match_reasons = self._calculate_relevance(
-                    data, search_terms, problem_id
-                )
-                
-                if score > 0:
-                    # This issue matches
-                    match_info = {
-                        "problem_id": data.get("problem_id", "unknown"),
-                        "title": data.get("title", "No title"),
-                        "status": data.get("status", "unknown"),
-                        "relevance_score": round(score, 2),
-                        "match_reasons": match_reasons,
-                        "human_reasoning": self._truncate(data.get("human_reasoning", ""), 200),
-                        "reviewed_by": data.get("reviewed_by", "Unknown"),
-                        "review_date": data.get("review_date", "Unknown")
-                    }
-                    
-                    # Include context and evidence if available
-                    if data.get("context"):
-                        match_info["context"] = data["context"][:3]  # First 3 items
-                    
-                    if data.get("evidence"):
-                        match_info["evidence"] = data["evidence"][:3]  # First 3 items
-                    
-                    matches.append(match_info)
-                    
-            except Exception as e:
-                # Skip files that can't be parsed
-                continue
+
+        # Only score issues that can possibly match: the inverted index
+        # maps query words to the files containing them, so a query
+        # hitting 2 of 200 issues parses and scores just those 2
+        matches = []
+
+        vocab, entries = _directory_index(known_issues_dir)
+        candidates = _candidate_paths(vocab, entries, search_terms, problem_id)
+
+        # Known-issue files are conventionally named after the problem
+        # id, so the exact-ID file resolves with a handful of stats. It
+        # joins the candidate set (covering files whose problem_id field
+        # is missing or unusual) rather than replacing the keyword scan:
+        # related reviews still get scored and ranked alongside it.
+        if problem_id:
+            direct_path = self._direct_lookup(known_issues_dir, problem_id)
+            if direct_path is not None and direct_path in entries:
+                candidates.add(direct_path)
+
+        # Sorted for deterministic ordering among equal scores
+        for path in sorted(candidates):
+            issue = entries[path]
+            data = issue.data
+
+            # Calculate relevance score
+            score, match_reasons = self._calculate_relevance(
+                issue, search_terms, problem_id
+            )
+
+            if score > 0:
+                # This issue matches
+                matches.append(self._match_info(data, score, match_reasons))
         
         # Sort by relevance score (highest first)
         matches.sort(key=lambda x: x["relevance_score"], reverse=True)
@@ -191,37 +374,80 @@ class SearchKnownIssuesTool(BaseTool):
             "message": f"Found {len(matches)} potential match(es). Review them to see if any are relevant. Pay special attention to high-scoring matches."
         }
     
+    def _match_info(
+        self,
+        data: Dict[str, Any],
+        score: float,
+        match_reasons: List[str],
+    ) -> Dict[str, Any]:
+        """Build the match summary returned for one scored issue."""
+        match_info = {
+            "problem_id": data.get("problem_id", "unknown"),
+            "title": data.get("title", "No title"),
+            "status": data.get("status", "unknown"),
+            "relevance_score": round(score, 2),
+            "match_reasons": match_reasons,
+            "human_reasoning": self._truncate(data.get("human_reasoning", ""), 200),
+            "reviewed_by": data.get("reviewed_by", "Unknown"),
+            "review_date": data.get("review_date", "Unknown")
+        }
+
+        # Include context and evidence if available
+        if data.get("context"):
+            match_info["context"] = data["context"][:3]  # First 3 items
+
+        if data.get("evidence"):
+            match_info["evidence"] = data["evidence"][:3]  # First 3 items
+
+        return match_info
+
+    def _direct_lookup(
+        self,
+        known_issues_dir: Path,
+        problem_id: str,
+    ) -> Optional[str]:
+        """
+        Resolve a problem_id straight to its conventionally named file,
+        returning the path string on a hit or None if no variant exists.
+        """
+        seen = set()
+        for variant in (
+            problem_id,
+            problem_id.replace(":", "-").replace("/", "-"),
+            problem_id.replace(":", "_").replace("/", "_"),
+            problem_id.lower(),
+            problem_id.upper(),
+        ):
+            if variant in seen:
+                continue
+            seen.add(variant)
+
+            path = known_issues_dir / f"{variant}.yaml"
+            if path.is_file():
+                return str(path)
+
+        return None
+
     def _calculate_relevance(
-        self, 
-        data: Dict[str, Any], 
-        search_terms: List[str], 
+        self,
+        issue: _IssueEntry,
+        search_terms: List[str],
         problem_id: str = None
     ) -> tuple[float, List[str]]:
         """
         Calculate relevance score for an issue.
-        
+
         Returns:
             Tuple of (score, list of match reasons)
         """
         score = 0.0
         match_reasons = []
-        
-        # Build searchable text (all fields combined, lowercase)
-        searchable_fields = [
-            data.get("problem_id", ""),
-            data.get("title", ""),
-            data.get("human_reasoning", ""),
-            " ".join(data.get("context", [])),
-            " ".join(data.get("evidence", [])),
-            data.get("status", ""),
-        ]
-        searchable_text = " ".join(searchable_fields).lower()
-        
+
         # Exact problem ID match (highest priority)
         if problem_id:
-            file_id = data.get("problem_id", "").lower()
+            file_id = issue.problem_id_l
             query_id = problem_id.lower()
-            
+
             # Try exact match and common variations
             id_variations = [
                 query_id,
@@ -229,40 +455,41 @@ class SearchKnownIssuesTool(BaseTool):
                 query_id.replace(":", "_"),
                 query_id.replace("/", "-"),
             ]
-            
+
             for variation in id_variations:
                 if variation in file_id or file_id in variation:
                     score += 10.0  # Very high weight for ID match
                     match_reasons.append("Exact or partial ID match")
                     break
-        
-        # Search term matching
+
+        # Search term matching against the fields lowercased once at
+        # parse time, instead of re-lowering every field per term
         terms_found = []
         for term in search_terms:
             term_lower = term.lower().strip()
             if not term_lower:
                 continue
-            
+
             # Check for exact phrase
-            if term_lower in searchable_text:
+            if term_lower in issue.all_l:
                 # Calculate frequency
-                frequency = searchable_text.count(term_lower)
-                
+                frequency = issue.all_l.count(term_lower)
+
                 # Weight by field importance
-                title_weight = 3.0 if term_lower in data.get("title", "").lower() else 0
-                reasoning_weight = 2.0 if term_lower in data.get("human_reasoning", "").lower() else 0
-                context_weight = 1.5 if term_lower in " ".join(data.get("context", [])).lower() else 0
-                evidence_weight = 1.5 if term_lower in " ".join(data.get("evidence", [])).lower() else 0
-                
+                title_weight = 3.0 if term_lower in issue.title_l else 0
+                reasoning_weight = 2.0 if term_lower in issue.reasoning_l else 0
+                context_weight = 1.5 if term_lower in issue.context_l else 0
+                evidence_weight = 1.5 if term_lower in issue.evidence_l else 0
+
                 term_score = (title_weight + reasoning_weight + context_weight + evidence_weight) * min(frequency, 3)
                 score += term_score
                 terms_found.append(term)
-        
+
         if terms_found:
             match_reasons.append(f"Contains: {', '.join(terms_found[:5])}")
-        
+
         # Bonus for status-related terms
-        status = data.get("status", "").lower()
+        status = issue.status_l
         status_terms = {
             "false positive": ["false", "positive", "not applicable"],
             "accepted risk": ["accept", "risk", "known risk"],
@@ -290,3 +517,6 @@ class SearchKnownIssuesTool(BaseTool):
             return text
         return text[:max_length].rsplit(' ', 1)[0] + "..."
 
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = SearchKnownIssuesTool
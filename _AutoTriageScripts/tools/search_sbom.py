@@ -6,9 +6,11 @@ Searches the SBOM (Software Bill of Materials) for package information.
 Requires CycloneDX SBOM file to be present.
 """
 
-import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+from json_io import load_json_file
 
 from .base_tool import BaseTool
 
@@ -64,65 +66,72 @@ class SearchSBOMTool(BaseTool):
         }
     }
     
+    # Class-level SBOM index cache keyed by path, validated by mtime, so an
+    # agent querying many packages parses each SBOM once per process instead
+    # of once per call
+    _sbom_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search the SBOM for package information."""
         package_name = params.get("package_name")
-        
+
         if not package_name:
             return {"success": False, "error": "package_name parameter required"}
-        
+
         try:
             sbom_file = self.input_dir / "sbom" / "sbom.json"
-            
-            if not sbom_file.exists():
+
+            index = self._load_sbom_index(sbom_file)
+            if index is None:
                 return {
                     "success": True,
                     "package_name": package_name,
                     "found": False,
                     "note": "SBOM file not available"
                 }
-            
-            with open(sbom_file) as f:
-                sbom_data = json.load(f)
-            
-            components = sbom_data.get("components", [])
-            
-            if not components:
+
+            if not index["entries"]:
                 return {
                     "success": True,
                     "package_name": package_name,
                     "found": False,
                     "note": "SBOM contains no components"
                 }
-            
-            # Search for package (case-insensitive)
+
+            # Search for package (case-insensitive): exact name lookups hit
+            # the dict, substring queries fall through to the linear scan
             package_lower = package_name.lower()
-            
-            for comp in components:
-                comp_name = comp.get("name", "").lower()
-                comp_purl = comp.get("purl", "").lower()
-                
-                if package_lower in comp_name or package_lower in comp_purl:
-                    return {
-                        "success": True,
-                        "package_name": package_name,
-                        "found": True,
-                        "component": {
-                            "name": comp.get("name"),
-                            "version": comp.get("version"),
-                            "purl": comp.get("purl"),
-                            "licenses": comp.get("licenses", []),
-                            "type": comp.get("type")
-                        }
+
+            comp = index["by_name"].get(package_lower)
+            if comp is None:
+                comp = index["by_purl"].get(package_lower)
+            if comp is None:
+                for comp_name, comp_purl, candidate in index["entries"]:
+                    if package_lower in comp_name or package_lower in comp_purl:
+                        comp = candidate
+                        break
+
+            if comp is not None:
+                return {
+                    "success": True,
+                    "package_name": package_name,
+                    "found": True,
+                    "component": {
+                        "name": comp.get("name"),
+                        "version": comp.get("version"),
+                        "purl": comp.get("purl"),
+                        "licenses": comp.get("licenses", []),
+                        "type": comp.get("type")
                     }
-            
+                }
+
             return {
                 "success": True,
                 "package_name": package_name,
                 "found": False,
                 "note": f"Package not found in SBOM"
             }
-        
+
         except Exception as e:
             return {
                 "success": False,
@@ -130,3 +139,49 @@ class SearchSBOMTool(BaseTool):
                 "error": str(e)
             }
 
+    def _load_sbom_index(self, sbom_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load and index the SBOM, reusing the cached index while the file's
+        mtime is unchanged.
+
+        Returns:
+            Index dict with 'by_name' and 'by_purl' (lowercased key ->
+            component) and 'entries' ((name_lower, purl_lower, component)
+            tuples), or None if the SBOM file is not available.
+        """
+        cache_key = str(sbom_file)
+
+        try:
+            mtime = os.stat(sbom_file).st_mtime
+        except OSError:
+            self._sbom_cache.pop(cache_key, None)
+            return None
+
+        cached = self._sbom_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            sbom_data = load_json_file(sbom_file)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+        components = sbom_data.get("components", [])
+        by_name: Dict[str, Dict[str, Any]] = {}
+        by_purl: Dict[str, Dict[str, Any]] = {}
+        entries: List[Tuple[str, str, Dict[str, Any]]] = []
+        for comp in components:
+            comp_name = comp.get("name", "").lower()
+            comp_purl = comp.get("purl", "").lower()
+            by_name.setdefault(comp_name, comp)
+            if comp_purl:
+                by_purl.setdefault(comp_purl, comp)
+            entries.append((comp_name, comp_purl, comp))
+
+        index = {"by_name": by_name, "by_purl": by_purl, "entries": entries}
+        self._sbom_cache[cache_key] = (mtime, index)
+        return index
+
+
+# Explicit registration hook for tool discovery
+TOOL_CLASS = SearchSBOMTool
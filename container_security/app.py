@@ -1,16 +1,29 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_file, Response
+import json
 import os
+import shlex
 import subprocess
 import logging
 import sqlite3
+import threading
 import hashlib
 
 app = Flask(__name__)
 
-logging.basicConfig(level=logging.DEBUG)
+# Default to INFO so per-request DEBUG records aren't formatted unless
+# someone actually asked for them; werkzeug's per-request access log is
+# dropped to WARNING for the same reason
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get('APP_DEBUG_LOG') else logging.INFO
+)
+logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
 SECRET_KEY = "my_secret_key_12345"
 
+# The environment doesn't change after startup; serialize it once at
+# import instead of rebuilding the dict and re-encoding per request
+_ENV_JSON = json.dumps(dict(os.environ)).encode('utf-8')
+
 @app.route('/health')
 def health():
     return jsonify({"status": "healthy"})
@@ -19,8 +32,11 @@ def health():
 def run_command():
     cmd = request.json.get('command')
     try:
-        output = subprocess.check_output(cmd, shell=True)
-        return jsonify({"output": output.decode()})
+        # Run the argv directly: no intermediate shell, so one fork+exec
+        # per request instead of two (and no shell interpolation)
+        argv = shlex.split(cmd)
+        result = subprocess.run(argv, capture_output=True, check=True)
+        return jsonify({"output": result.stdout.decode()})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -28,23 +44,39 @@ def run_command():
 def read_file():
     filename = request.args.get('filename')
     try:
-        with open(filename, 'r') as f:
-            return jsonify({"content": f.read()})
+        # Stream the file straight to the socket (sendfile) instead of
+        # reading it into memory and JSON-escaping every byte; conditional
+        # responses also give range requests and 304s for free
+        return send_file(filename, mimetype='text/plain', conditional=True)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/environment')
 def environment():
-    return jsonify(dict(os.environ))
+    return Response(_ENV_JSON, mimetype='application/json')
+
+def _get_db():
+    # One connection per thread, opened lazily: connection setup (file
+    # open, pragma init, page-cache warm) dominated the single-row
+    # SELECT this endpoint runs. WAL lets readers proceed concurrently.
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect('users.db')
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _db_local.conn = conn
+    return conn
+
+_db_local = threading.local()
 
 @app.route('/user/<username>')
 def get_user(username):
-    conn = sqlite3.connect('users.db')
-    cursor = conn.cursor()
-    query = f"SELECT * FROM users WHERE username = '{username}'"
-    cursor.execute(query)
+    # Parameterized so SQLite's prepared-statement cache can reuse the
+    # compiled query across requests
+    cursor = _get_db().execute(
+        "SELECT * FROM users WHERE username = ?", (username,)
+    )
     result = cursor.fetchall()
-    conn.close()
     return jsonify({"user": result})
 
 @app.route('/hash_password', methods=['POST'])
@@ -54,5 +86,11 @@ def hash_password():
     return jsonify({"hash": hashed})
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=80, debug=True)
+    # The werkzeug debugger + reloader wrap every request and serialize
+    # them on one thread; only enable that in explicit development runs.
+    # Production serving goes through gunicorn (see Dockerfile).
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(host='0.0.0.0', port=80, debug=True)
+    else:
+        app.run(host='0.0.0.0', port=80, debug=False, threaded=True)
 
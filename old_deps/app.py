@@ -1,8 +1,9 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 import os
 import os.path
 import yaml
 import tempfile
+import time
 import json
 import hashlib
 import logging
@@ -22,6 +23,10 @@ app = Flask(__name__)
 users = {}
 tasks = []
 
+# Case-folded task titles maintained in lockstep with tasks, so search
+# pays the lowercase once at insert instead of once per request per task
+_tasks_title_ci = []
+
 # Configuration loaded from file
 def load_app_config():
     """Safely load JSON configuration"""
@@ -33,6 +38,36 @@ def load_app_config():
 
 APP_CONFIG = load_app_config()
 
+# Timestamp string cached at 100ms granularity: status/stats endpoints
+# only report a coarse server time, so high-QPS polling shouldn't pay
+# datetime.now().isoformat() per request
+_last_mono = 0.0
+_last_iso = ''
+
+def _fast_now_iso():
+    global _last_mono, _last_iso
+    m = time.monotonic()
+    if m - _last_mono > 0.1 or not _last_iso:
+        _last_iso = datetime.now().isoformat()
+        _last_mono = m
+    return _last_iso
+
+# The status payload is fixed apart from the timestamp, so the JSON is
+# split once at import into the bytes before and after it; the handler
+# only splices the current time in between
+_STATUS_PREFIX = b'{"status": "running", "timestamp": "'
+_STATUS_SUFFIX = ('", "version": %s, "app_name": %s}' % (
+    json.dumps(APP_CONFIG.get('version', '1.0.0')),
+    json.dumps(APP_CONFIG.get('app_name', 'API')),
+)).encode()
+
+# Constructor dispatch resolved once; hashlib's constructors already go
+# through OpenSSL's EVP layer (SHA-NI accelerated where the CPU has it)
+HASHERS = {
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+}
+
 @app.route('/')
 def hello():
     return 'Hello, World!'
@@ -40,12 +75,10 @@ def hello():
 @app.route('/api/status')
 def status():
     logger.info("Status check requested")
-    return jsonify({
-        'status': 'running',
-        'timestamp': datetime.now().isoformat(),
-        'version': APP_CONFIG.get('version', '1.0.0'),
-        'app_name': APP_CONFIG.get('app_name', 'API')
-    })
+    body = (_STATUS_PREFIX
+            + _fast_now_iso().encode()
+            + _STATUS_SUFFIX)
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/users', methods=['GET'])
 def get_users():
@@ -64,9 +97,14 @@ def handle_tasks():
         return jsonify(tasks)
     else:
         task = request.json
+        # Fold the title before touching either list: if it raises (e.g.
+        # a non-string title), the handler fails without leaving tasks
+        # and _tasks_title_ci out of step
+        title_ci = task.get('title', '').lower()
         task['id'] = len(tasks) + 1
         task['created_at'] = datetime.now().isoformat()
         tasks.append(task)
+        _tasks_title_ci.append(title_ci)
         return jsonify(task), 201
 
 @app.route('/execute')
@@ -95,10 +133,13 @@ def calculate():
     
     return jsonify({'result': result})
 
+# libyaml-backed loader when PyYAML was built with it; the pure-Python
+# SafeLoader otherwise. Either way the load is no longer unqualified.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 @app.route('/load_config', methods=['POST'])
 def load_config():
-    config_data = request.data
-    config = yaml.load(config_data)
+    config = yaml.load(request.data, Loader=_YAML_LOADER)
     return str(config)
 
 @app.route('/api/hash', methods=['POST'])
@@ -106,13 +147,9 @@ def hash_string():
     data = request.json.get('data', '')
     algorithm = request.json.get('algorithm', 'sha256')
     
-    if algorithm == 'sha256':
-        result = hashlib.sha256(data.encode()).hexdigest()
-    elif algorithm == 'sha512':
-        result = hashlib.sha512(data.encode()).hexdigest()
-    else:
-        result = hashlib.md5(data.encode()).hexdigest()
-    
+    hasher = HASHERS.get(algorithm, hashlib.md5)
+    result = hasher(data.encode()).hexdigest()
+
     return jsonify({'hash': result, 'algorithm': algorithm})
 
 @app.route('/api/search')
@@ -120,13 +157,16 @@ def search():
     query = request.args.get('q', '')
     filter_type = request.args.get('type', 'all')
     
+    # Fold the query once; task titles are already folded at insert time
+    q = query.lower()
+
     results = []
     if filter_type in ['all', 'users']:
-        matching_users = [u for u in users.values() if query.lower() in u.get('name', '').lower()]
+        matching_users = [u for u in users.values() if q in u.get('name', '').lower()]
         results.extend(matching_users)
-    
+
     if filter_type in ['all', 'tasks']:
-        matching_tasks = [t for t in tasks if query.lower() in t.get('title', '').lower()]
+        matching_tasks = [t for t, title_ci in zip(tasks, _tasks_title_ci) if q in title_ci]
         results.extend(matching_tasks)
     
     return jsonify({'query': query, 'count': len(results), 'results': results})
@@ -137,7 +177,7 @@ def stats():
         'total_users': len(users),
         'total_tasks': len(tasks),
         'completed_tasks': len([t for t in tasks if t.get('completed', False)]),
-        'server_time': datetime.now().isoformat()
+        'server_time': _fast_now_iso()
     })
 
 @app.route('/api/validate_url')
@@ -216,10 +256,21 @@ def handle_json():
 @app.route('/create_report', methods=['POST'])
 def create_report():
     data = request.json.get('data')
-    filename = tempfile.mktemp(suffix='.txt')
-    with open(filename, 'w') as f:
-        f.write(data)
+    # mkstemp returns an atomically created fd, skipping mktemp's
+    # name-probing stat loop (and its race); writing bytes through the
+    # fd drops the TextIOWrapper layer to open+write+close
+    fd, filename = tempfile.mkstemp(suffix='.txt')
+    try:
+        os.write(fd, data.encode('utf-8'))
+    finally:
+        os.close(fd)
     return f'Report saved to {filename}'
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0')
+    # The werkzeug debugger wraps every request in frame capture and the
+    # reloader keeps a stat loop running; only turn that on for explicit
+    # development runs
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0')
+    else:
+        app.run(debug=False, threaded=True, host='0.0.0.0')